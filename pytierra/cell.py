@@ -1,18 +1,18 @@
 """Cell: memory regions, CPU, demographics."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 from .cpu import CPU
 
 
-@dataclass
+@dataclass(slots=True)
 class MemRegion:
     pos: int
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Demographics:
     genotype: str = ""
     parent_genotype: str = ""
@@ -8,6 +8,7 @@ from typing import Optional, Callable, Any
 from .config import Config
 from .simulation import Simulation
 from .datalog import DataCollector
+from .genebank import Genotype
 
 import numpy as np
 
@@ -43,12 +44,39 @@ class GenotypeSnapshot:
     """Immutable snapshot of a genotype."""
     name: str
     genome: bytes
+    size: int
     population: int
     max_pop: int
     parent: str
     origin_time: int
 
 
+@dataclass(frozen=True)
+class GenotypeArrays:
+    """Column-wise snapshot of the living genotypes.
+
+    Row i of every array describes the same genotype. Cheaper to build
+    and compare than one GenotypeSnapshot per genotype.
+    """
+    names: np.ndarray        # object (str)
+    sizes: np.ndarray        # int64
+    populations: np.ndarray  # int64
+    max_pops: np.ndarray     # int64
+    parents: np.ndarray      # object (str)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def same_counts(self, other: "GenotypeArrays") -> bool:
+        """True if both hold the same genotypes with the same counts."""
+        return (
+            len(self) == len(other)
+            and np.array_equal(self.populations, other.populations)
+            and np.array_equal(self.max_pops, other.max_pops)
+            and np.array_equal(self.names, other.names)
+        )
+
+
 class SimulationController:
     """Thread-safe wrapper around Simulation.
 
@@ -94,8 +122,14 @@ class SimulationController:
         self._thread.start()
 
     def pause(self) -> None:
-        """Pause the simulation (thread stays alive but idle)."""
+        """Pause the simulation (thread stays alive but idle).
+
+        Returns once any batch already in progress has finished, so the
+        simulation state is stable afterwards.
+        """
         self._running.clear()
+        with self._lock:
+            pass
 
     def stop(self) -> None:
         """Stop the simulation thread entirely."""
@@ -159,11 +193,7 @@ class SimulationController:
             if self._sim is None or self._sim.genebank is None:
                 return None
             if name in self._sim.genebank.genotypes:
-                gt = self._sim.genebank.genotypes[name]
-                return GenotypeSnapshot(
-                    name=gt.name, genome=gt.genome, population=gt.population,
-                    max_pop=gt.max_pop, parent=gt.parent, origin_time=gt.origin_time,
-                )
+                return self._snapshot_genotype(self._sim.genebank.genotypes[name])
         return None
 
     def read_soup(self, addr: int, count: int) -> bytes:
@@ -176,17 +206,28 @@ class SimulationController:
     def get_all_genotypes(self) -> list[GenotypeSnapshot]:
         """Return snapshots of all living genotypes (population > 0)."""
         with self._lock:
-            if self._sim is None or self._sim.genebank is None:
-                return []
-            result = []
-            for gt in self._sim.genebank.genotypes.values():
-                if gt.population > 0:
-                    result.append(GenotypeSnapshot(
-                        name=gt.name, genome=gt.genome,
-                        population=gt.population, max_pop=gt.max_pop,
-                        parent=gt.parent, origin_time=gt.origin_time,
-                    ))
-            return result
+            return [self._snapshot_genotype(gt) for gt in self._living_genotypes()]
+
+    def get_genotype_arrays(self) -> GenotypeArrays:
+        """Return living genotypes (population > 0) as aligned numpy columns."""
+        with self._lock:
+            return self._genotype_arrays(self._living_genotypes())
+
+    def get_genotype_table(
+        self, last: Optional[GenotypeArrays] = None,
+    ) -> tuple[GenotypeArrays, Optional[list[GenotypeSnapshot]]]:
+        """Return living genotypes as columns, plus snapshots if they changed.
+
+        Both are taken under one lock, so the snapshots describe the same
+        state as the arrays. The snapshot list is None when the arrays
+        match last (same genotypes with the same counts).
+        """
+        with self._lock:
+            living = self._living_genotypes()
+            arrays = self._genotype_arrays(living)
+            if last is not None and arrays.same_counts(last):
+                return arrays, None
+            return arrays, [self._snapshot_genotype(gt) for gt in living]
 
     def get_soup_image(self, width: int = 512) -> np.ndarray:
         """Render the soup as an RGBA numpy array.
@@ -199,6 +240,17 @@ class SimulationController:
                 return np.zeros((1, width, 4), dtype=np.uint8)
             return self._render_soup(width)
 
+    def get_soup_opcodes(self, width: int = 512) -> np.ndarray:
+        """Return the soup as a (height, width) uint8 array of opcodes 0-31.
+
+        Cheaper than get_soup_image() for palette-based display: one byte
+        per address instead of four.
+        """
+        with self._lock:
+            if self._sim is None:
+                return np.zeros((1, width), dtype=np.uint8)
+            return self._soup_opcodes(width)
+
     def inject_genome(self, genome: bytes, position: int) -> bool:
         """Add a creature at the given position."""
         with self._lock:
@@ -251,6 +303,8 @@ class SimulationController:
             with self._lock:
                 if self._sim is None:
                     break
+                if not self._running.is_set():
+                    continue  # paused while waiting for the lock
                 for _ in range(self._slices_per_tick):
                     cell = self._sim.scheduler.current()
                     if cell is None:
@@ -273,6 +327,41 @@ class SimulationController:
         if self._sim is not None and self.data_collector.should_sample(self._sim.inst_executed):
             self.data_collector.sample(self._sim)
 
+    def _living_genotypes(self) -> list[Genotype]:
+        """Genotypes with population > 0; call with the lock held."""
+        if self._sim is None or self._sim.genebank is None:
+            return []
+        return [gt for gt in self._sim.genebank.genotypes.values() if gt.population > 0]
+
+    @staticmethod
+    def _genotype_arrays(living: list[Genotype]) -> GenotypeArrays:
+        # One pass over the genotypes; zip() transposes the rows in C
+        rows = [
+            (gt.name, len(gt.genome), gt.population, gt.max_pop, gt.parent)
+            for gt in living
+        ]
+        n = len(rows)
+        names, sizes, populations, max_pops, parents = zip(*rows) if n else ((),) * 5
+        name_col = np.empty(n, dtype=object)
+        name_col[:] = names
+        parent_col = np.empty(n, dtype=object)
+        parent_col[:] = parents
+        return GenotypeArrays(
+            names=name_col,
+            sizes=np.array(sizes, dtype=np.int64),
+            populations=np.array(populations, dtype=np.int64),
+            max_pops=np.array(max_pops, dtype=np.int64),
+            parents=parent_col,
+        )
+
+    @staticmethod
+    def _snapshot_genotype(gt: Genotype) -> GenotypeSnapshot:
+        return GenotypeSnapshot(
+            name=gt.name, genome=gt.genome, size=len(gt.genome),
+            population=gt.population, max_pop=gt.max_pop,
+            parent=gt.parent, origin_time=gt.origin_time,
+        )
+
     @staticmethod
     def _snapshot_cell(cell) -> CellSnapshot:
         return CellSnapshot(
@@ -299,17 +388,22 @@ class SimulationController:
             daughter_size=cell.md.size if cell.md else None,
         )
 
-    def _render_soup(self, width: int) -> np.ndarray:
-        """Render soup data to RGBA image array."""
+    def _soup_opcodes(self, width: int) -> np.ndarray:
+        """Return soup opcodes padded and reshaped to (height, width)."""
         soup_size = self._sim.config.soup_size
         height = (soup_size + width - 1) // width
 
         # Pad soup data to full image size
         padded = np.zeros(height * width, dtype=np.uint8)
-        padded[:soup_size] = self._sim.soup.data
+        np.remainder(self._sim.soup.data, 32, out=padded[:soup_size])
+        return padded.reshape(height, width)
+
+    def _render_soup(self, width: int) -> np.ndarray:
+        """Render soup data to RGBA image array."""
+        opcodes = self._soup_opcodes(width).ravel()
+        height = len(opcodes) // width
 
         # Map opcodes to colors (32 colors for 32 instructions)
-        opcodes = padded % 32
         rgba = np.zeros((height * width, 4), dtype=np.uint8)
         rgba[:, 0] = _OPCODE_COLORS[opcodes, 0]
         rgba[:, 1] = _OPCODE_COLORS[opcodes, 1]
@@ -2,6 +2,7 @@
 
 from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,9 +21,12 @@ class TimeSeriesLog:
     def __init__(self, capacity: int = 10_000):
         self.capacity = capacity
         self.data: deque[DataPoint] = deque(maxlen=capacity)
+        self._recorded: int = 0  # total points ever recorded (not capped)
+        self._generation: int = 0  # bumped by clear()
 
     def record(self, time: int, value: float) -> None:
         self.data.append(DataPoint(time, value))
+        self._recorded += 1
 
     def values(self) -> list[float]:
         return [p.value for p in self.data]
@@ -30,11 +34,49 @@ class TimeSeriesLog:
     def times(self) -> list[int]:
         return [p.time for p in self.data]
 
+    @property
+    def total_recorded(self) -> int:
+        """Number of points recorded since creation or the last clear().
+
+        Unlike len(), this keeps growing once the ring buffer is full, so
+        readers can use it as a cursor for incremental updates.
+        """
+        return self._recorded
+
+    @property
+    def generation(self) -> int:
+        """Number of times the log has been cleared.
+
+        total_recorded restarts from 0 on clear(), so incremental readers
+        compare this to tell a refilled log from one that kept growing.
+        """
+        return self._generation
+
+    def values_from(self, start: int) -> list[float]:
+        """Return values of points whose record index is >= start."""
+        return [p.value for p in self._points_from(start)]
+
+    def times_from(self, start: int) -> list[int]:
+        """Return times of points whose record index is >= start."""
+        return [p.time for p in self._points_from(start)]
+
+    def _points_from(self, start: int) -> list[DataPoint]:
+        # Walk from the newest end so the cost is proportional to the
+        # number of new points, not the size of the buffer.
+        count = min(self._recorded - start, len(self.data))
+        if count <= 0:
+            return []
+        points = list(islice(reversed(self.data), count))
+        points.reverse()
+        return points
+
     def last(self) -> Optional[DataPoint]:
         return self.data[-1] if self.data else None
 
     def clear(self) -> None:
         self.data.clear()
+        self._recorded = 0
+        self._generation += 1
 
     def __len__(self) -> int:
         return len(self.data)
@@ -79,7 +121,7 @@ class DataCollector:
 
         # Mean creature size
         if num_cells > 0:
-            avg_size = sum(c.mm.size for c in sim.scheduler.queue) / num_cells
+            avg_size = sim.scheduler.total_size / num_cells
             self.mean_creature_size.record(t, avg_size)
         else:
             self.mean_creature_size.record(t, 0)
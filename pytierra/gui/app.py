@@ -5,7 +5,7 @@ import sys
 import time
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QSettings
+from PySide6.QtCore import Qt, QEvent, QTimer, Signal, QObject, QSettings
 from PySide6.QtGui import QAction, QColor, QKeySequence, QPalette
 from PySide6.QtWidgets import (
     QApplication, QFileDialog, QLabel, QMainWindow, QMenu, QMessageBox,
@@ -431,9 +431,9 @@ class MainWindow(QMainWindow):
         if self._controller.simulation is None:
             return
 
-        # Soup image
-        rgba = self._controller.get_soup_image(self._soup_view.grid_width)
         soup_size = self._controller.simulation.config.soup_size
+        # Skip rendering the soup image while the window is minimized
+        render_soup = not self.isMinimized()
 
         # Get all cells once (reused for overlays and status bar count)
         needs_overlays = (self._show_cells_action.isChecked() or
@@ -451,7 +451,9 @@ class MainWindow(QMainWindow):
                 cells = self._controller.get_all_cells()
             self._soup_view.set_cell_data([])
 
-        self._soup_view.update_image(rgba, soup_size)
+        if render_soup:
+            opcodes = self._controller.get_soup_opcodes(self._soup_view.grid_width)
+            self._soup_view.update_image(opcodes, soup_size)
 
         # Status bar metrics
         inst = self._controller.inst_executed
@@ -635,10 +637,10 @@ class MainWindow(QMainWindow):
         self._debug_tab.set_cell(cell)
         if cell is not None:
             self._status_bar.show_hover_info(addr, cell.genotype, cell.size)
-            self._debug_tab.refresh(self._controller)
             gt = self._controller.get_genotype(cell.genotype)
             self._inspect_tab.set_genotype(gt)
             self._tabs.setCurrentIndex(0)  # Switch to Debug tab
+            self._debug_tab.refresh(self._controller)
 
     def _on_genotype_selected(self, name: str) -> None:
         gt = self._controller.get_genotype(name)
@@ -684,6 +686,13 @@ class MainWindow(QMainWindow):
             f'<p><a href="http://life.ou.edu/tierra/">Original Tierra Project</a></p>'
         )
 
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        # Catch up on soup rendering skipped while minimized
+        if (event.type() == QEvent.Type.WindowStateChange
+                and not self.isMinimized()):
+            self._update_ui()
+
     def closeEvent(self, event) -> None:
         self._refresh_timer.stop()
         self._controller.stop()
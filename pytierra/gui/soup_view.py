@@ -1,10 +1,45 @@
 """SoupView widget — renders the Tierra soup as a colored grid."""
 
+import functools
+
 import numpy as np
 from PySide6.QtCore import Qt, Signal, QPoint
-from PySide6.QtGui import QImage, QPainter, QWheelEvent, QMouseEvent
+from PySide6.QtGui import QImage, QPainter, QWheelEvent, QMouseEvent, qRgb
 from PySide6.QtWidgets import QWidget
 
+from pytierra.controller import _OPCODE_COLORS
+
+# Indexed-color palette layout: 0-31 opcode colors, 32-63 the same colors
+# with the fecundity heat tint applied, 64 the IP marker.
+_HEAT_OFFSET = 32
+_IP_INDEX = 64
+_HEAT_DELTA = np.array([40, 20, -30])
+_IP_COLOR = (0, 255, 0)
+
+_HEAT_COLORS = np.clip(_OPCODE_COLORS.astype(np.int16) + _HEAT_DELTA, 0, 255)
+_COLOR_TABLE = (
+    [qRgb(int(r), int(g), int(b)) for r, g, b in _OPCODE_COLORS]
+    + [qRgb(int(r), int(g), int(b)) for r, g, b in _HEAT_COLORS]
+    + [qRgb(*_IP_COLOR)]
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _genotype_color(name: str) -> tuple[int, int, int]:
+    """Return a stable overlay tint for a genotype name.
+
+    Uses 32-bit FNV-1a over the name bytes rather than hash(), which is
+    salted per interpreter run, so colors are reproducible across sessions.
+    """
+    h = 2166136261
+    for b in name.encode():
+        h = ((h ^ b) * 16777619) & 0xFFFFFFFF
+    return (
+        ((h >> 16) & 0xFF) // 2 + 64,
+        ((h >> 8) & 0xFF) // 2 + 64,
+        (h & 0xFF) // 2 + 64,
+    )
+
 
 class SoupView(QWidget):
     """Widget that displays the soup memory as a 2D colored image.
@@ -32,8 +67,14 @@ class SoupView(QWidget):
         self._show_ips = False
         self._show_fecundity = False
 
-        # Cell data for overlays (set externally before paint)
-        self._cell_overlays: list[tuple[int, int, int, str]] = []  # (pos, size, ip, genotype)
+        # Cell data for overlays (set externally before paint), stored as
+        # parallel arrays with each cell's genotype as an index into
+        # _palette so the overlay pass is a single gather.
+        self._cell_pos = np.zeros(0, dtype=np.int64)
+        self._cell_size = np.zeros(0, dtype=np.int64)
+        self._cell_ip = np.zeros(0, dtype=np.int64)
+        self._cell_color_idx = np.zeros(0, dtype=np.int32)
+        self._palette = np.zeros((0, 3), dtype=np.uint8)
 
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
@@ -53,23 +94,44 @@ class SoupView(QWidget):
 
     def set_cell_data(self, cells: list[tuple[int, int, int, str]]) -> None:
         """Set cell overlay data: list of (pos, size, ip, genotype)."""
-        self._cell_overlays = cells
+        n = len(cells)
+        self._cell_pos = np.fromiter((c[0] for c in cells), np.int64, n)
+        self._cell_size = np.fromiter((c[1] for c in cells), np.int64, n)
+        self._cell_ip = np.fromiter((c[2] for c in cells), np.int64, n)
+
+        # Rebuilt each call from the genotypes alive now, so dead ones
+        # don't accumulate over a long run
+        palette_idx: dict[str, int] = {}
+        color_idx = np.empty(n, dtype=np.int32)
+        for i, (_pos, _size, _ip, genotype) in enumerate(cells):
+            idx = palette_idx.get(genotype)
+            if idx is None:
+                idx = palette_idx[genotype] = len(palette_idx)
+            color_idx[i] = idx
+        self._palette = np.array(
+            [_genotype_color(g) for g in palette_idx], dtype=np.uint8
+        ).reshape(-1, 3)
+        self._cell_color_idx = color_idx
 
-    def update_image(self, rgba: np.ndarray, soup_size: int) -> None:
-        """Update the displayed image from an RGBA numpy array (H, W, 4)."""
+    def _cell_addresses(self, total: int) -> np.ndarray:
+        """Return the image index of every address covered by a cell."""
+        sizes = self._cell_size
+        starts = np.repeat(self._cell_pos, sizes)
+        # Offset of each address within its cell: 0..size-1 per cell
+        offsets = np.arange(len(starts)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        return (starts + offsets) % total
+
+    def update_image(self, opcodes: np.ndarray, soup_size: int) -> None:
+        """Update the displayed image from an opcode array (H, W) of 0-31."""
         self._soup_size = soup_size
-        h, w = rgba.shape[:2]
+        h, w = opcodes.shape
         self._grid_width = w
 
-        # Apply overlays in-place on a copy
-        display = rgba.copy()
-        if self._show_cells or self._show_ips or self._show_fecundity:
-            self._apply_overlays(display)
-
-        # Convert numpy RGBA to QImage (deep copy to decouple from numpy)
-        self._image = QImage(
-            display.data, w, h, w * 4, QImage.Format.Format_RGBA8888
-        ).copy()
+        if self._show_cells:
+            # Genotype tints are arbitrary colors, so blend in RGB
+            self._image = self._render_rgb(opcodes)
+        else:
+            self._image = self._render_indexed(opcodes)
 
         # Resize widget to match zoomed image
         self.setMinimumSize(
@@ -77,40 +139,55 @@ class SoupView(QWidget):
         )
         self.update()
 
-    def _apply_overlays(self, rgba: np.ndarray) -> None:
-        """Apply visual overlays to the RGBA array."""
-        h, w = rgba.shape[:2]
-        total = h * w
-
-        for pos, size, ip, genotype in self._cell_overlays:
-            if self._show_cells:
-                # Color cell boundaries with genotype-based color
-                hue = hash(genotype) & 0xFFFFFF
-                r = ((hue >> 16) & 0xFF) // 2 + 64
-                g = ((hue >> 8) & 0xFF) // 2 + 64
-                b = (hue & 0xFF) // 2 + 64
-
-                for addr in range(pos, pos + size):
-                    idx = addr % total
-                    # Semi-transparent blend
-                    rgba[idx // w, idx % w, 0] = (rgba[idx // w, idx % w, 0] + r) // 2
-                    rgba[idx // w, idx % w, 1] = (rgba[idx // w, idx % w, 1] + g) // 2
-                    rgba[idx // w, idx % w, 2] = (rgba[idx // w, idx % w, 2] + b) // 2
-
+    def _render_indexed(self, opcodes: np.ndarray) -> QImage:
+        """Build a palette image; heat and IP overlays are palette entries."""
+        h, w = opcodes.shape
+        indices = opcodes
+        if self._show_fecundity or self._show_ips:
+            indices = opcodes.copy()
+            flat = indices.reshape(-1)
             if self._show_fecundity:
-                # Yellow-orange heat on occupied memory
-                for addr in range(pos, pos + size):
-                    idx = addr % total
-                    row, col = idx // w, idx % w
-                    rgba[row, col, 0] = min(255, rgba[row, col, 0] + 40)
-                    rgba[row, col, 1] = min(255, rgba[row, col, 1] + 20)
-                    rgba[row, col, 2] = max(0, rgba[row, col, 2] - 30)
-
+                addrs = self._cell_addresses(h * w)
+                flat[addrs] = opcodes.reshape(-1)[addrs] + _HEAT_OFFSET
             if self._show_ips:
-                # Bright green pixel at IP
-                idx = ip % total
-                row, col = idx // w, idx % w
-                rgba[row, col] = [0, 255, 0, 255]
+                flat[self._cell_ip % (h * w)] = _IP_INDEX
+
+        # Deep copy to decouple the QImage from the numpy buffer
+        image = QImage(
+            indices.data, w, h, w, QImage.Format.Format_Indexed8
+        ).copy()
+        image.setColorTable(_COLOR_TABLE)
+        return image
+
+    def _render_rgb(self, opcodes: np.ndarray) -> QImage:
+        """Build an RGB image with all overlays applied."""
+        h, w = opcodes.shape
+        rgb = _OPCODE_COLORS[opcodes]
+        self._apply_overlays(rgb.reshape(-1, 3))
+        return QImage(
+            rgb.data, w, h, w * 3, QImage.Format.Format_RGB888
+        ).copy()
+
+    def _apply_overlays(self, rgb: np.ndarray) -> None:
+        """Apply visual overlays to a flat (N, 3) RGB array in place."""
+        total = len(rgb)
+        addrs = self._cell_addresses(total)
+        pixels = rgb[addrs].astype(np.int16)
+
+        if self._show_cells:
+            # Semi-transparent blend with each cell's genotype color
+            colors = self._palette[self._cell_color_idx]
+            pixels = (pixels + np.repeat(colors, self._cell_size, axis=0)) // 2
+
+        if self._show_fecundity:
+            # Yellow-orange heat on occupied memory
+            pixels = np.clip(pixels + _HEAT_DELTA, 0, 255)
+
+        rgb[addrs] = pixels
+
+        if self._show_ips:
+            # Bright green pixel at IP
+            rgb[self._cell_ip % total] = _IP_COLOR
 
     def zoom_to_fit(self) -> None:
         """Adjust zoom so the full image fits in the viewport."""
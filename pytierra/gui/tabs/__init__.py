@@ -1,10 +1,58 @@
 """Tabbed inspector panels for the PyTierra GUI."""
 
+from typing import Any, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
 from PySide6.QtGui import QImage
 
 import numpy as np
 
-from pytierra.controller import _OPCODE_COLORS
+from pytierra.controller import _OPCODE_COLORS, SimulationController
+
+_CONFIG_FLUSH_MS = 50  # coalescing window for settings edits
+
+
+class ConfigWriter(QObject):
+    """Coalesces settings edits into one controller update per burst.
+
+    Dragging a spin box emits valueChanged for every intermediate value;
+    the writer keeps only the latest value per key and pushes them all
+    with a single update_config() at most once per coalescing window.
+    """
+
+    flushed = Signal()
+
+    def __init__(self, parent: Optional[QObject] = None,
+                 delay_ms: int = _CONFIG_FLUSH_MS):
+        super().__init__(parent)
+        self._controller: Optional[SimulationController] = None
+        self._pending: dict[str, Any] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def set_controller(self, controller: Optional[SimulationController]) -> None:
+        # Pending edits belong to the old simulation
+        self._timer.stop()
+        self._pending.clear()
+        self._controller = controller
+
+    def set(self, key: str, value: Any) -> None:
+        """Queue a config change, opening a coalescing window if needed."""
+        self._pending[key] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Push all pending changes now."""
+        self._timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        if self._controller is not None:
+            self._controller.update_config(**pending)
+        self.flushed.emit()
 
 
 def render_genome_bar(genome: bytes, height: int = 20) -> QImage:
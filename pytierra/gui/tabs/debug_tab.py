@@ -132,6 +132,8 @@ class DebugTab(QWidget):
 
     def refresh(self, controller: SimulationController) -> None:
         """Refresh disassembly and genome bar from controller. Called per UI tick."""
+        if not self.isVisible():
+            return
         cell = self._cell
         if cell is None:
             return
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
 )
 
 from pytierra.controller import SimulationController
+from pytierra.datalog import TimeSeriesLog
 
 # Configure pyqtgraph defaults
 pg.setConfigOptions(antialias=True, background="k", foreground="w")
@@ -32,12 +33,72 @@ _HISTOGRAMS = [
 ]
 
 
+class _SeriesBuffer:
+    """Growing NumPy copy of a TimeSeriesLog, extended with only new points.
+
+    Capacity doubles as needed; once the log's ring buffer starts dropping
+    old points, stale entries are shifted out instead of growing further.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        self.times = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self.values = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self.size: int = 0      # entries currently held in the arrays
+        self.recorded: int = 0  # series.total_recorded at last sync
+        self.generation: int = 0  # series.generation at last sync
+
+    def sync(self, series: TimeSeriesLog) -> None:
+        """Pull any points recorded since the last sync."""
+        total = series.total_recorded
+        if (series.generation != self.generation
+                or total - self.recorded > len(series)):
+            # Series was cleared, or more points arrived than the ring
+            # buffer retains: start over from what is still available.
+            self.size = 0
+            self.recorded = total - len(series)
+            self.generation = series.generation
+        if total == self.recorded:
+            return
+
+        new_times = series.times_from(self.recorded)
+        new_values = series.values_from(self.recorded)
+        n = len(new_times)
+        keep = min(self.size, len(series) - n)
+
+        if self.size + n > len(self.times):
+            if keep < self.size:
+                # Drop points that have fallen out of the ring buffer
+                self.times[:keep] = self.times[self.size - keep:self.size]
+                self.values[:keep] = self.values[self.size - keep:self.size]
+                self.size = keep
+            if self.size + n > len(self.times):
+                capacity = len(self.times)
+                while capacity < self.size + n:
+                    capacity *= 2
+                self.times = np.resize(self.times, capacity)
+                self.values = np.resize(self.values, capacity)
+
+        self.times[self.size:self.size + n] = new_times
+        self.values[self.size:self.size + n] = new_values
+        self.size += n
+        self.recorded = total
+
+    def visible(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return views of the newest count points."""
+        start = max(0, self.size - count)
+        return self.times[start:self.size], self.values[start:self.size]
+
+
 class GraphTab(QWidget):
     """Real-time graphs and histograms of evolutionary dynamics."""
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self._last_series_len: int = 0
+        # (generation, total_recorded) of the series last plotted
+        self._last_series_key: Optional[tuple[int, int]] = None
+        self._buffers: dict[str, _SeriesBuffer] = {}
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -66,14 +127,20 @@ class GraphTab(QWidget):
         self._plot_widget.showGrid(x=True, y=True, alpha=0.3)
         layout.addWidget(self._plot_widget, stretch=1)
 
-        # Create the line plot item (reused for time-series)
+        # Create the line plot item (reused for time-series). Peak
+        # downsampling reduces long series to ~2 points per pixel column
+        # (keeping spikes), and clipping skips points outside the view.
         self._line = self._plot_widget.plot(pen=pg.mkPen("c", width=2))
+        self._line.setDownsampling(auto=True, method="peak")
+        self._line.setClipToView(True)
 
         # Bar chart item (created on demand for histograms)
         self._bar_item: Optional[pg.BarGraphItem] = None
 
     def refresh(self, controller: SimulationController) -> None:
         """Update the currently displayed graph from controller data."""
+        if not self.isVisible():
+            return
         idx = self._selector.currentIndex()
         num_ts = len(_TIME_SERIES)
 
@@ -88,7 +155,8 @@ class GraphTab(QWidget):
         """Clear all graph data."""
         self._line.setData([], [])
         self._remove_bar_item()
-        self._last_series_len = 0
+        self._last_series_key = None
+        self._buffers.clear()
 
     def _on_selection_changed(self, _idx: int) -> None:
         # Clear previous data and reset axis labels
@@ -96,7 +164,7 @@ class GraphTab(QWidget):
         self._remove_bar_item()
         self._plot_widget.setLabel("bottom", "")
         self._plot_widget.setLabel("left", "")
-        self._last_series_len = 0
+        self._last_series_key = None
         # Reset x-axis to linear (in case it was set to category for histograms)
         axis = self._plot_widget.getAxis("bottom")
         axis.setTicks(None)
@@ -108,15 +176,20 @@ class GraphTab(QWidget):
         if series is None or len(series) == 0:
             return
 
-        # Skip update if data hasn't changed
-        if len(series) == self._last_series_len:
+        # Skip update if data hasn't changed; a clear bumps the generation,
+        # so a refill back to the old count still redraws
+        key_state = (series.generation, series.total_recorded)
+        if key_state == self._last_series_key:
             return
-        self._last_series_len = len(series)
+        self._last_series_key = key_state
 
         self._remove_bar_item()
 
-        times = np.array(series.times(), dtype=np.float64)
-        values = np.array(series.values(), dtype=np.float64)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = _SeriesBuffer()
+        buf.sync(series)
+        times, values = buf.visible(len(series))
 
         self._line.setData(times, values)
         self._plot_widget.setLabel("bottom", "Instructions")
@@ -1,14 +1,244 @@
 """Inventory tab — sortable table of all living genotypes."""
 
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QAbstractTableModel, QModelIndex, Qt, QTimer, Signal,
+)
 from PySide6.QtWidgets import (
-    QHeaderView, QLineEdit, QTableWidget, QTableWidgetItem,
-    QVBoxLayout, QWidget,
+    QAbstractItemView, QHeaderView, QLineEdit, QTableView, QVBoxLayout,
+    QWidget,
+)
+
+from pytierra.controller import (
+    GenotypeArrays, GenotypeSnapshot, SimulationController,
 )
 
-from pytierra.controller import SimulationController
+_HEADERS = ["Name", "Size", "Population", "Max Pop", "Parent"]
+_NUMERIC_COLUMNS = (1, 2, 3)
+_COUNT_COLUMNS = (2, 3)  # the only columns that change for a living genotype
+_FILTER_DELAY_MS = 150  # debounce for filter-as-you-type
+_NUMERIC_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class GenotypeTableModel(QAbstractTableModel):
+    """Table model over a list of genotype snapshots.
+
+    Filtering and sorting are applied in Python to a cached view list, so
+    the view only calls data() for rows it actually paints. (Sorting in a
+    QSortFilterProxyModel instead calls data() O(n log n) times per
+    refresh, which dominates for large populations.)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._genotypes: list[GenotypeSnapshot] = []
+        self._view_list: list[GenotypeSnapshot] = []
+        self._lower_names: dict[str, str] = {}  # name -> name.lower()
+        self._filter_text: str = ""
+        self._sort_column: int = 0
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_genotypes(self, genotypes: list[GenotypeSnapshot]) -> None:
+        """Replace the genotype list, emitting only the row changes needed.
+
+        Rows for extinct genotypes are removed, survivors are reordered
+        with a layout change only if their order changed, count cells
+        that changed get dataChanged, and new genotypes are inserted.
+        """
+        prev = self._genotypes
+        self._genotypes = genotypes
+        old_rows = self._view_list
+        # Names never change, so carry lowercased names across refreshes
+        lower = self._lower_names
+        self._lower_names = {
+            gt.name: lower.get(gt.name) or gt.name.lower() for gt in genotypes
+        }
+        if (self._sort_column not in _COUNT_COLUMNS and len(prev) == len(genotypes)
+                and all(a.name == b.name for a, b in zip(prev, genotypes))):
+            # Same genotypes and a sort key that can't change: the old
+            # row order still holds, so skip the filter and the sort
+            by_name = {gt.name: gt for gt in genotypes}
+            new_rows = [by_name[gt.name] for gt in old_rows]
+        else:
+            new_rows = self._filtered_sorted()
+        first_col, last_col = _COUNT_COLUMNS[0], _COUNT_COLUMNS[-1]
+
+        # Common case: same rows in the same order, only counts changed
+        if len(new_rows) == len(old_rows) and all(
+            a.name == b.name for a, b in zip(old_rows, new_rows)
+        ):
+            changed = [
+                i for i, (a, b) in enumerate(zip(old_rows, new_rows))
+                if a.population != b.population or a.max_pop != b.max_pop
+            ]
+            self._view_list = new_rows
+            for start, end in _runs(changed):
+                self.dataChanged.emit(
+                    self.index(start, first_col), self.index(end, last_col)
+                )
+            return
+
+        new_index = {gt.name: i for i, gt in enumerate(new_rows)}
+
+        # Bulk replacement (first fill, new soup, loaded state): with no
+        # survivors there is nothing to keep, so one reset beats
+        # emitting a remove and an insert per run
+        if not any(gt.name in new_index for gt in old_rows):
+            self.beginResetModel()
+            self._view_list = new_rows
+            self.endResetModel()
+            return
+
+        old_by_name = {gt.name: gt for gt in old_rows}
+
+        # 1. Remove extinct rows, highest first so indices stay valid
+        removed = [i for i, gt in enumerate(old_rows) if gt.name not in new_index]
+        for start, end in reversed(_runs(removed)):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._view_list[start:end + 1]
+            self.endRemoveRows()
+
+        # 2. Survivors take their new order and values
+        survivors = [gt for gt in new_rows if gt.name in old_by_name]
+        reordered = any(
+            a.name != b.name for a, b in zip(self._view_list, survivors)
+        )
+        if reordered:
+            self.layoutAboutToBeChanged.emit()
+            survivor_row = {gt.name: i for i, gt in enumerate(survivors)}
+            old_persistent = self.persistentIndexList()
+            names = [self._view_list[idx.row()].name for idx in old_persistent]
+            self._view_list = survivors
+            self.changePersistentIndexList(old_persistent, [
+                self.index(survivor_row[name], idx.column())
+                for name, idx in zip(names, old_persistent)
+            ])
+            self.layoutChanged.emit()
+        else:
+            self._view_list = survivors
+            changed = [
+                i for i, gt in enumerate(survivors)
+                if (gt.population, gt.max_pop)
+                != (old_by_name[gt.name].population, old_by_name[gt.name].max_pop)
+            ]
+            for start, end in _runs(changed):
+                self.dataChanged.emit(
+                    self.index(start, first_col), self.index(end, last_col)
+                )
+
+        # 3. Insert new genotypes at their final positions, lowest first
+        added = [i for i, gt in enumerate(new_rows) if gt.name not in old_by_name]
+        for start, end in _runs(added):
+            self.beginInsertRows(QModelIndex(), start, end)
+            self._view_list[start:start] = new_rows[start:end + 1]
+            self.endInsertRows()
+
+    def set_filter(self, text: str) -> None:
+        """Filter rows by case-insensitive name substring.
+
+        Applied as a single model reset; a no-op if the effective filter
+        is unchanged (e.g. only the letter case differs). When the new
+        text extends the old one (typing more characters), only the rows
+        already shown can match, so those are narrowed in place without
+        re-sorting.
+        """
+        text = text.lower()
+        old_text = self._filter_text
+        if text == old_text:
+            return
+        self.beginResetModel()
+        self._filter_text = text
+        if old_text in text:
+            lower = self._lower_names
+            self._view_list = [gt for gt in self._view_list if text in lower[gt.name]]
+        else:
+            self._rebuild_view()
+        self.endResetModel()
+
+    def genotype_at(self, row: int) -> GenotypeSnapshot:
+        return self._view_list[row]
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_order = order
+        self._rebuild_view()
+        self.endResetModel()
+
+    def _rebuild_view(self) -> None:
+        self._view_list = self._filtered_sorted()
+
+    def _filtered_sorted(self) -> list[GenotypeSnapshot]:
+        text = self._filter_text
+        if text:
+            lower = self._lower_names
+            rows = [gt for gt in self._genotypes if text in lower[gt.name]]
+        else:
+            rows = list(self._genotypes)
+        rows.sort(
+            key=_SORT_KEYS[self._sort_column],
+            reverse=self._sort_order == Qt.SortOrder.DescendingOrder,
+        )
+        return rows
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._view_list)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self._value(self._view_list[index.row()], col))
+        if role == Qt.ItemDataRole.TextAlignmentRole and col in _NUMERIC_COLUMNS:
+            return _NUMERIC_ALIGNMENT
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return _HEADERS[section]
+        return None
+
+    @staticmethod
+    def _value(gt: GenotypeSnapshot, col: int) -> Any:
+        if col == 0:
+            return gt.name
+        if col == 1:
+            return gt.size
+        if col == 2:
+            return gt.population
+        if col == 3:
+            return gt.max_pop
+        return gt.parent
+
+
+# Sort keys per column; attrgetter extracts keys in C rather than through
+# a Python call per row, and the raw ints/strs then compare natively.
+_SORT_KEYS = {
+    0: attrgetter("name"),
+    1: attrgetter("size"),
+    2: attrgetter("population"),
+    3: attrgetter("max_pop"),
+    4: attrgetter("parent"),
+}
+
+
+def _runs(indices: list[int]) -> list[tuple[int, int]]:
+    """Group ascending indices into contiguous (start, end) ranges."""
+    runs: list[tuple[int, int]] = []
+    for i in indices:
+        if runs and runs[-1][1] == i - 1:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+    return runs
 
 
 class InventoryTab(QWidget):
@@ -18,6 +248,7 @@ class InventoryTab(QWidget):
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        self._last_arrays: Optional[GenotypeArrays] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -29,84 +260,68 @@ class InventoryTab(QWidget):
         self._filter = QLineEdit()
         self._filter.setPlaceholderText("Filter genotypes...")
         self._filter.setToolTip("Type to filter genotypes by name")
-        self._filter.textChanged.connect(self._apply_filter)
+        self._filter.textChanged.connect(self._filter_timer_start)
         layout.addWidget(self._filter)
 
+        # Collapse bursts of keystrokes into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
+        # Model (sorting and filtering happen inside the model)
+        self._model = GenotypeTableModel(self)
+
         # Table
-        self._table = QTableWidget(0, 5)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setToolTip("Click a row to inspect that genotype")
-        self._table.setHorizontalHeaderLabels(
-            ["Name", "Size", "Population", "Max Pop", "Parent"]
-        )
         self._table.setSortingEnabled(True)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self._table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeMode.Stretch
-        )
-        self._table.cellClicked.connect(self._on_cell_clicked)
+        self._table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        header = self._table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        # Numeric widths are bounded, so never measure cell contents to size them
+        numeric_width = self._table.fontMetrics().horizontalAdvance("99999999")
+        for col in _NUMERIC_COLUMNS:
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+            self._table.setColumnWidth(col, numeric_width)
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._table.clicked.connect(self._on_cell_clicked)
         layout.addWidget(self._table)
 
     def refresh(self, controller: SimulationController) -> None:
-        """Rebuild table from controller data."""
-        genotypes = controller.get_all_genotypes()
-
-        # Preserve sort state
-        sort_col = self._table.horizontalHeader().sortIndicatorSection()
-        sort_order = self._table.horizontalHeader().sortIndicatorOrder()
+        """Reload the table model from controller data."""
+        # Most ticks nothing was born or died; the controller compares
+        # compact column arrays before paying for one snapshot object
+        # per genotype, and only builds snapshots when they differ
+        arrays, genotypes = controller.get_genotype_table(self._last_arrays)
+        self._last_arrays = arrays
+        if genotypes is None:
+            return
+        # Suppress repaints while the model resets; one repaint follows
+        self._table.setUpdatesEnabled(False)
+        try:
+            self._model.set_genotypes(genotypes)
+        finally:
+            self._table.setUpdatesEnabled(True)
 
-        self._table.setSortingEnabled(False)
-        self._table.setRowCount(len(genotypes))
+    def _filter_timer_start(self, _text: str) -> None:
+        self._filter_timer.start()
 
-        for row, gt in enumerate(genotypes):
-            name_item = QTableWidgetItem(gt.name)
-            size_item = _NumericItem(len(gt.genome))
-            pop_item = _NumericItem(gt.population)
-            maxpop_item = _NumericItem(gt.max_pop)
-            parent_item = QTableWidgetItem(gt.parent)
-
-            self._table.setItem(row, 0, name_item)
-            self._table.setItem(row, 1, size_item)
-            self._table.setItem(row, 2, pop_item)
-            self._table.setItem(row, 3, maxpop_item)
-            self._table.setItem(row, 4, parent_item)
-
-        self._table.setSortingEnabled(True)
-        self._table.sortItems(sort_col, sort_order)
-        self._apply_filter(self._filter.text())
+    def _apply_filter(self) -> None:
+        self._model.set_filter(self._filter.text())
 
-    def _apply_filter(self, text: str) -> None:
-        text = text.lower()
-        for row in range(self._table.rowCount()):
-            name_item = self._table.item(row, 0)
-            if name_item is None:
-                continue
-            visible = text in name_item.text().lower()
-            self._table.setRowHidden(row, not visible)
-
-    def _on_cell_clicked(self, row: int, _col: int) -> None:
-        name_item = self._table.item(row, 0)
-        if name_item is not None:
-            self.genotype_selected.emit(name_item.text())
+    def _on_cell_clicked(self, index: QModelIndex) -> None:
+        if index.isValid():
+            self.genotype_selected.emit(self._model.genotype_at(index.row()).name)
 
     def clear(self) -> None:
         """Clear the table."""
-        self._table.setRowCount(0)
+        self._last_arrays = None
+        self._model.set_genotypes([])
         self._filter.clear()
-
-
-class _NumericItem(QTableWidgetItem):
-    """Table item that sorts numerically."""
-
-    def __init__(self, value: int):
-        super().__init__(str(value))
-        self._value = value
-        self.setTextAlignment(
-            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-        )
-
-    def __lt__(self, other: QTableWidgetItem) -> bool:
-        if isinstance(other, _NumericItem):
-            return self._value < other._value
-        return super().__lt__(other)
+        self._filter_timer.stop()
+        self._apply_filter()
@@ -1,15 +1,18 @@
 """Mutation settings tab — controls for all mutation rate parameters."""
 
+from functools import partial
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
-    QDoubleSpinBox, QGroupBox, QHBoxLayout, QLabel, QPushButton,
+    QDoubleSpinBox, QFormLayout, QGroupBox, QHBoxLayout, QLabel, QPushButton,
     QSpinBox, QVBoxLayout, QWidget,
 )
 
 from pytierra.controller import SimulationController
 
+from . import ConfigWriter
+
 
 # Preset values: (gen_per_bkg_mut, gen_per_flaw, gen_per_div_mut)
 _PRESETS = {
@@ -20,6 +23,37 @@ _PRESETS = {
     "Very High": (2, 2, 2),
 }
 
+# Settings groups: (title, rows, key whose rate label follows the group).
+# Rows are (config_key, label, min, max, default, step, tooltip); a step
+# of None makes an integer spin box.
+_GROUPS = [
+    ("Cosmic Ray (Background Mutation)", [
+        ("gen_per_bkg_mut", "Generations per mutation:", 0, 1000, 32, None,
+         "0 = disabled. Lower = more frequent mutations."),
+    ], "gen_per_bkg_mut"),
+    ("Copy Error (Division Mutation)", [
+        ("gen_per_div_mut", "Generations per mutation:", 0, 1000, 32, None,
+         "0 = disabled. Applied at cell division."),
+    ], None),
+    ("Execution Flaw", [
+        ("gen_per_flaw", "Generations per flaw:", 0, 1000, 32, None,
+         "0 = disabled. Random instruction errors during execution."),
+    ], "gen_per_flaw"),
+    ("Mutation Type", [
+        ("mut_bit_prop", "Bit-flip probability:", 0.0, 1.0, 0.2, 0.05,
+         "Probability of bit-flip vs. random replacement when mutating."),
+    ], None),
+    ("Genetic Operators (at Division)", [
+        ("gen_per_cro_ins_sam_siz", "Crossover (same size):", 0, 1000, 32, None, ""),
+        ("gen_per_cro_ins", "Crossover (size-changing):", 0, 1000, 32, None, ""),
+        ("gen_per_ins_ins", "Instruction insertion:", 0, 1000, 32, None, ""),
+        ("gen_per_del_ins", "Instruction deletion:", 0, 1000, 32, None, ""),
+        ("gen_per_cro_seg", "Segment crossover:", 0, 1000, 32, None, ""),
+        ("gen_per_ins_seg", "Segment insertion:", 0, 1000, 32, None, ""),
+        ("gen_per_del_seg", "Segment deletion:", 0, 1000, 32, None, ""),
+    ], None),
+]
+
 
 class MutationTab(QWidget):
     """Settings panel for mutation rates."""
@@ -27,10 +61,15 @@ class MutationTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._controller: Optional[SimulationController] = None
+        self._shown_rate_mut: Optional[float] = None
+        self._shown_rate_flaw: Optional[float] = None
+        self._config_writer = ConfigWriter(self)
+        self._config_writer.flushed.connect(self._update_rate_labels)
         self._setup_ui()
 
     def set_controller(self, controller: SimulationController) -> None:
         self._controller = controller
+        self._config_writer.set_controller(controller)
         self._load_from_config()
 
     def _setup_ui(self) -> None:
@@ -38,89 +77,23 @@ class MutationTab(QWidget):
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(8)
 
-        # --- Cosmic Ray (Background) Mutations ---
-        cosmic_group = QGroupBox("Cosmic Ray (Background Mutation)")
-        cosmic_layout = QVBoxLayout(cosmic_group)
-
-        self._gen_per_bkg_mut = self._add_spin_row(
-            cosmic_layout, "Generations per mutation:", 0, 1000, 32,
-            "gen_per_bkg_mut",
-            tooltip="0 = disabled. Lower = more frequent mutations."
-        )
-        self._rate_mut_label = QLabel("Rate: --")
-        self._rate_mut_label.setStyleSheet("font-size: 10px; color: #888;")
-        cosmic_layout.addWidget(self._rate_mut_label)
-        layout.addWidget(cosmic_group)
-
-        # --- Copy Error (Division Mutation) ---
-        copy_group = QGroupBox("Copy Error (Division Mutation)")
-        copy_layout = QVBoxLayout(copy_group)
-
-        self._gen_per_div_mut = self._add_spin_row(
-            copy_layout, "Generations per mutation:", 0, 1000, 32,
-            "gen_per_div_mut",
-            tooltip="0 = disabled. Applied at cell division."
-        )
-        layout.addWidget(copy_group)
-
-        # --- Execution Flaw ---
-        flaw_group = QGroupBox("Execution Flaw")
-        flaw_layout = QVBoxLayout(flaw_group)
-
-        self._gen_per_flaw = self._add_spin_row(
-            flaw_layout, "Generations per flaw:", 0, 1000, 32,
-            "gen_per_flaw",
-            tooltip="0 = disabled. Random instruction errors during execution."
-        )
-        self._rate_flaw_label = QLabel("Rate: --")
-        self._rate_flaw_label.setStyleSheet("font-size: 10px; color: #888;")
-        flaw_layout.addWidget(self._rate_flaw_label)
-        layout.addWidget(flaw_group)
-
-        # --- Bit flip proportion ---
-        bitflip_group = QGroupBox("Mutation Type")
-        bitflip_layout = QVBoxLayout(bitflip_group)
-
-        self._mut_bit_prop = self._add_double_spin_row(
-            bitflip_layout, "Bit-flip probability:", 0.0, 1.0, 0.2, 0.05,
-            "mut_bit_prop",
-            tooltip="Probability of bit-flip vs. random replacement when mutating."
-        )
-        layout.addWidget(bitflip_group)
-
-        # --- Genetic Operators (Division-time) ---
-        genetic_group = QGroupBox("Genetic Operators (at Division)")
-        genetic_layout = QVBoxLayout(genetic_group)
-
-        self._gen_per_cro_ins_sam_siz = self._add_spin_row(
-            genetic_layout, "Crossover (same size):", 0, 1000, 32,
-            "gen_per_cro_ins_sam_siz"
-        )
-        self._gen_per_cro_ins = self._add_spin_row(
-            genetic_layout, "Crossover (size-changing):", 0, 1000, 32,
-            "gen_per_cro_ins"
-        )
-        self._gen_per_ins_ins = self._add_spin_row(
-            genetic_layout, "Instruction insertion:", 0, 1000, 32,
-            "gen_per_ins_ins"
-        )
-        self._gen_per_del_ins = self._add_spin_row(
-            genetic_layout, "Instruction deletion:", 0, 1000, 32,
-            "gen_per_del_ins"
-        )
-        self._gen_per_cro_seg = self._add_spin_row(
-            genetic_layout, "Segment crossover:", 0, 1000, 32,
-            "gen_per_cro_seg"
-        )
-        self._gen_per_ins_seg = self._add_spin_row(
-            genetic_layout, "Segment insertion:", 0, 1000, 32,
-            "gen_per_ins_seg"
-        )
-        self._gen_per_del_seg = self._add_spin_row(
-            genetic_layout, "Segment deletion:", 0, 1000, 32,
-            "gen_per_del_seg"
-        )
-        layout.addWidget(genetic_group)
+        self._spins: dict[str, QSpinBox | QDoubleSpinBox] = {}
+        rate_labels: dict[str, QLabel] = {}
+        for title, rows, rate_key in _GROUPS:
+            group = QGroupBox(title)
+            form = QFormLayout(group)
+            for key, label, min_val, max_val, default, step, tooltip in rows:
+                self._spins[key] = self._add_row(
+                    form, label, min_val, max_val, default, step, key, tooltip,
+                )
+            if rate_key is not None:
+                rate_label = QLabel("Rate: --")
+                rate_label.setStyleSheet("font-size: 10px; color: #888;")
+                form.addRow(rate_label)
+                rate_labels[rate_key] = rate_label
+            layout.addWidget(group)
+        self._rate_mut_label = rate_labels["gen_per_bkg_mut"]
+        self._rate_flaw_label = rate_labels["gen_per_flaw"]
 
         # --- Preset buttons ---
         preset_row = QWidget()
@@ -130,103 +103,77 @@ class MutationTab(QWidget):
         for name, values in _PRESETS.items():
             btn = QPushButton(name)
             btn.setMaximumWidth(80)
-            btn.clicked.connect(lambda checked, v=values: self._apply_preset(v))
+            btn.clicked.connect(partial(self._apply_preset, values))
             preset_layout.addWidget(btn)
         preset_layout.addStretch()
         layout.addWidget(preset_row)
 
         layout.addStretch()
 
-    def _add_spin_row(
-        self, parent_layout: QVBoxLayout, label: str,
-        min_val: int, max_val: int, default: int,
+    def _add_row(
+        self, form: QFormLayout, label: str,
+        min_val: float, max_val: float, default: float, step: Optional[float],
         config_key: str, tooltip: str = "",
-    ) -> QSpinBox:
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-
-        lbl = QLabel(label)
-        if tooltip:
-            lbl.setToolTip(tooltip)
-        row_layout.addWidget(lbl)
-
-        spin = QSpinBox()
+    ) -> QSpinBox | QDoubleSpinBox:
+        if step is None:
+            spin = QSpinBox()
+        else:
+            spin = QDoubleSpinBox()
+            spin.setSingleStep(step)
         spin.setRange(min_val, max_val)
         spin.setValue(default)
         spin.setMaximumWidth(100)
         if tooltip:
             spin.setToolTip(tooltip)
-        spin.valueChanged.connect(lambda v, k=config_key: self._on_value_changed(k, v))
-        row_layout.addWidget(spin)
-
-        parent_layout.addWidget(row)
-        return spin
-
-    def _add_double_spin_row(
-        self, parent_layout: QVBoxLayout, label: str,
-        min_val: float, max_val: float, default: float, step: float,
-        config_key: str, tooltip: str = "",
-    ) -> QDoubleSpinBox:
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-
-        lbl = QLabel(label)
+        spin.valueChanged.connect(partial(self._on_value_changed, config_key))
+        form.addRow(label, spin)
         if tooltip:
-            lbl.setToolTip(tooltip)
-        row_layout.addWidget(lbl)
-
-        spin = QDoubleSpinBox()
-        spin.setRange(min_val, max_val)
-        spin.setValue(default)
-        spin.setSingleStep(step)
-        spin.setMaximumWidth(100)
-        if tooltip:
-            spin.setToolTip(tooltip)
-        spin.valueChanged.connect(lambda v, k=config_key: self._on_value_changed(k, v))
-        row_layout.addWidget(spin)
-
-        parent_layout.addWidget(row)
+            form.labelForField(spin).setToolTip(tooltip)
         return spin
 
     def _on_value_changed(self, config_key: str, value) -> None:
-        if self._controller is not None:
-            self._controller.update_config(**{config_key: value})
-        self._update_rate_labels()
+        self._config_writer.set(config_key, value)
 
     def _apply_preset(self, values: tuple[int, int, int]) -> None:
         bkg, flaw, div = values
-        self._gen_per_bkg_mut.setValue(bkg)
-        self._gen_per_flaw.setValue(flaw)
-        self._gen_per_div_mut.setValue(div)
+        # Set all three silently, then push them as one config update
+        keys = ("gen_per_bkg_mut", "gen_per_flaw", "gen_per_div_mut")
+        for key, value in zip(keys, values):
+            spin = self._spins[key]
+            with QSignalBlocker(spin):
+                spin.setValue(value)
+        writer = self._config_writer
+        writer.set("gen_per_bkg_mut", bkg)
+        writer.set("gen_per_flaw", flaw)
+        writer.set("gen_per_div_mut", div)
+        writer.flush()
 
     def _load_from_config(self) -> None:
         if self._controller is None or self._controller.simulation is None:
             return
         cfg = self._controller.simulation.config
-        self._gen_per_bkg_mut.setValue(cfg.gen_per_bkg_mut)
-        self._gen_per_div_mut.setValue(cfg.gen_per_div_mut)
-        self._gen_per_flaw.setValue(cfg.gen_per_flaw)
-        self._mut_bit_prop.setValue(cfg.mut_bit_prop)
-        self._gen_per_cro_ins_sam_siz.setValue(cfg.gen_per_cro_ins_sam_siz)
-        self._gen_per_cro_ins.setValue(cfg.gen_per_cro_ins)
-        self._gen_per_ins_ins.setValue(cfg.gen_per_ins_ins)
-        self._gen_per_del_ins.setValue(cfg.gen_per_del_ins)
-        self._gen_per_cro_seg.setValue(cfg.gen_per_cro_seg)
-        self._gen_per_ins_seg.setValue(cfg.gen_per_ins_seg)
-        self._gen_per_del_seg.setValue(cfg.gen_per_del_seg)
+        # Values come from the config, so don't write them back to it
+        for key, spin in self._spins.items():
+            with QSignalBlocker(spin):
+                spin.setValue(getattr(cfg, key))
         self._update_rate_labels()
 
     def _update_rate_labels(self) -> None:
-        if self._controller is None or self._controller.simulation is None:
+        sim = self._controller.simulation if self._controller is not None else None
+        if sim is None:
             return
-        cfg = self._controller.simulation.config
-        if cfg.rate_mut > 0:
-            self._rate_mut_label.setText(f"Rate: {cfg.rate_mut:.6f} per inst")
-        else:
-            self._rate_mut_label.setText("Rate: disabled")
-        if cfg.rate_flaw > 0:
-            self._rate_flaw_label.setText(f"Rate: {cfg.rate_flaw:.6f} per inst")
-        else:
-            self._rate_flaw_label.setText("Rate: disabled")
+        cfg = sim.config
+        rate_mut, rate_flaw = cfg.rate_mut, cfg.rate_flaw
+        # Only reformat labels whose rate actually changed
+        if rate_mut != self._shown_rate_mut:
+            self._shown_rate_mut = rate_mut
+            self._rate_mut_label.setText(_format_rate(rate_mut))
+        if rate_flaw != self._shown_rate_flaw:
+            self._shown_rate_flaw = rate_flaw
+            self._rate_flaw_label.setText(_format_rate(rate_flaw))
+
+
+def _format_rate(rate: float) -> str:
+    if rate > 0:
+        return f"Rate: {rate:.6f} per inst"
+    return "Rate: disabled"
@@ -1,14 +1,19 @@
 """Other settings tab — allocation, reaper, division constraints, misc."""
 
+from contextlib import ExitStack
+from functools import partial
 from typing import Optional
 
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
-    QCheckBox, QComboBox, QDoubleSpinBox, QGroupBox, QHBoxLayout,
-    QLabel, QSpinBox, QVBoxLayout, QWidget,
+    QCheckBox, QComboBox, QDoubleSpinBox, QFormLayout, QGroupBox,
+    QSpinBox, QVBoxLayout, QWidget,
 )
 
 from pytierra.controller import SimulationController
 
+from . import ConfigWriter
+
 
 _MAL_MODES = {
     0: "First Fit",
@@ -18,6 +23,38 @@ _MAL_MODES = {
     4: "Near BX",
 }
 
+# Settings groups below the allocation mode. Rows are either
+# ("spin", config_key, label, min, max, default, step, tooltip), where a
+# step of None makes an integer spin box, or
+# ("check", config_key, label, tooltip) for 0/1 flags.
+_GROUPS = [
+    ("Reaper", [
+        ("spin", "reap_rnd_prop", "Reap random proportion:", 0.0, 1.0, 0.3, 0.05,
+         "Fraction of queue (oldest end) to randomly select victim from."),
+        ("check", "mal_reap_tol", "Near-address reaping",
+         "When allocation fails, prefer reaping cells near the requested address."),
+        ("spin", "mal_tol", "Near-address tolerance:", 1, 100, 20, None,
+         "Max distance = mal_tol * avg_size for near-address reaping."),
+    ]),
+    ("Division Constraints", [
+        ("check", "div_same_siz", "Require same size",
+         "Daughter must be same size as mother."),
+        ("check", "div_same_gen", "Require same genotype",
+         "Daughter must have same genotype as mother."),
+        ("spin", "mov_prop_thr_div", "Copy threshold for divide:", 0.0, 1.0, 0.7, 0.05,
+         "Proportion of genome that must be copied before division is allowed."),
+    ]),
+    ("Cell Constraints", [
+        ("spin", "min_cell_size", "Min cell size:", 1, 200, 12, None, ""),
+        ("spin", "search_limit", "Search limit multiplier:", 1, 50, 5, None,
+         "Multiplier for template matching search range."),
+    ]),
+    ("Disturbance", [
+        ("spin", "dist_prop", "Kill proportion:", 0.0, 1.0, 0.2, 0.05,
+         "Proportion of population killed per disturbance event."),
+    ]),
+]
+
 
 class OtherSettingsTab(QWidget):
     """Settings panel for allocation, reaper, division, and misc."""
@@ -25,10 +62,12 @@ class OtherSettingsTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._controller: Optional[SimulationController] = None
+        self._config_writer = ConfigWriter(self)
         self._setup_ui()
 
     def set_controller(self, controller: SimulationController) -> None:
         self._controller = controller
+        self._config_writer.set_controller(controller)
         self._load_from_config()
 
     def _setup_ui(self) -> None:
@@ -38,190 +77,84 @@ class OtherSettingsTab(QWidget):
 
         # --- Memory Allocation ---
         alloc_group = QGroupBox("Memory Allocation")
-        alloc_layout = QVBoxLayout(alloc_group)
-
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.addWidget(QLabel("Allocation mode:"))
+        alloc_form = QFormLayout(alloc_group)
         self._mal_mode = QComboBox()
         for mode_id, name in _MAL_MODES.items():
             self._mal_mode.addItem(name, mode_id)
         self._mal_mode.currentIndexChanged.connect(self._on_mal_mode_changed)
-        row_layout.addWidget(self._mal_mode)
-        alloc_layout.addWidget(row)
-
+        alloc_form.addRow("Allocation mode:", self._mal_mode)
         layout.addWidget(alloc_group)
 
-        # --- Reaper ---
-        reaper_group = QGroupBox("Reaper")
-        reaper_layout = QVBoxLayout(reaper_group)
-
-        self._reap_rnd_prop = self._add_double_row(
-            reaper_layout, "Reap random proportion:", 0.0, 1.0, 0.3, 0.05,
-            "reap_rnd_prop",
-            tooltip="Fraction of queue (oldest end) to randomly select victim from."
-        )
-
-        self._mal_reap_tol_check = QCheckBox("Near-address reaping")
-        self._mal_reap_tol_check.setToolTip(
-            "When allocation fails, prefer reaping cells near the requested address."
-        )
-        self._mal_reap_tol_check.toggled.connect(
-            lambda checked: self._on_changed("mal_reap_tol", 1 if checked else 0)
-        )
-        reaper_layout.addWidget(self._mal_reap_tol_check)
-
-        self._mal_tol = self._add_int_row(
-            reaper_layout, "Near-address tolerance:", 1, 100, 20,
-            "mal_tol",
-            tooltip="Max distance = mal_tol * avg_size for near-address reaping."
-        )
-
-        layout.addWidget(reaper_group)
-
-        # --- Division Constraints ---
-        div_group = QGroupBox("Division Constraints")
-        div_layout = QVBoxLayout(div_group)
-
-        self._div_same_siz = QCheckBox("Require same size")
-        self._div_same_siz.setToolTip("Daughter must be same size as mother.")
-        self._div_same_siz.toggled.connect(
-            lambda checked: self._on_changed("div_same_siz", 1 if checked else 0)
-        )
-        div_layout.addWidget(self._div_same_siz)
-
-        self._div_same_gen = QCheckBox("Require same genotype")
-        self._div_same_gen.setToolTip("Daughter must have same genotype as mother.")
-        self._div_same_gen.toggled.connect(
-            lambda checked: self._on_changed("div_same_gen", 1 if checked else 0)
-        )
-        div_layout.addWidget(self._div_same_gen)
-
-        self._mov_prop_thr_div = self._add_double_row(
-            div_layout, "Copy threshold for divide:", 0.0, 1.0, 0.7, 0.05,
-            "mov_prop_thr_div",
-            tooltip="Proportion of genome that must be copied before division is allowed."
-        )
-
-        layout.addWidget(div_group)
-
-        # --- Cell Constraints ---
-        cell_group = QGroupBox("Cell Constraints")
-        cell_layout = QVBoxLayout(cell_group)
-
-        self._min_cell_size = self._add_int_row(
-            cell_layout, "Min cell size:", 1, 200, 12,
-            "min_cell_size"
-        )
-
-        self._search_limit = self._add_int_row(
-            cell_layout, "Search limit multiplier:", 1, 50, 5,
-            "search_limit",
-            tooltip="Multiplier for template matching search range."
-        )
-
-        layout.addWidget(cell_group)
-
-        # --- Disturbance ---
-        dist_group = QGroupBox("Disturbance")
-        dist_layout = QVBoxLayout(dist_group)
-
-        self._dist_prop = self._add_double_row(
-            dist_layout, "Kill proportion:", 0.0, 1.0, 0.2, 0.05,
-            "dist_prop",
-            tooltip="Proportion of population killed per disturbance event."
-        )
-
-        layout.addWidget(dist_group)
+        # --- Table-driven groups ---
+        self._spins: dict[str, QSpinBox | QDoubleSpinBox] = {}
+        self._checks: dict[str, QCheckBox] = {}
+        for title, rows in _GROUPS:
+            group = QGroupBox(title)
+            form = QFormLayout(group)
+            for kind, key, *spec in rows:
+                if kind == "check":
+                    self._checks[key] = self._add_check_row(form, key, *spec)
+                else:
+                    self._spins[key] = self._add_spin_row(form, key, *spec)
+            layout.addWidget(group)
 
         layout.addStretch()
 
-    def _add_int_row(
-        self, parent_layout: QVBoxLayout, label: str,
-        min_val: int, max_val: int, default: int,
-        config_key: str, tooltip: str = "",
-    ) -> QSpinBox:
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-
-        lbl = QLabel(label)
-        if tooltip:
-            lbl.setToolTip(tooltip)
-        row_layout.addWidget(lbl)
-
-        spin = QSpinBox()
+    def _add_spin_row(
+        self, form: QFormLayout, config_key: str, label: str,
+        min_val: float, max_val: float, default: float, step: Optional[float],
+        tooltip: str = "",
+    ) -> QSpinBox | QDoubleSpinBox:
+        if step is None:
+            spin = QSpinBox()
+        else:
+            spin = QDoubleSpinBox()
+            spin.setSingleStep(step)
         spin.setRange(min_val, max_val)
         spin.setValue(default)
         spin.setMaximumWidth(100)
         if tooltip:
             spin.setToolTip(tooltip)
-        spin.valueChanged.connect(lambda v, k=config_key: self._on_changed(k, v))
-        row_layout.addWidget(spin)
-
-        parent_layout.addWidget(row)
-        return spin
-
-    def _add_double_row(
-        self, parent_layout: QVBoxLayout, label: str,
-        min_val: float, max_val: float, default: float, step: float,
-        config_key: str, tooltip: str = "",
-    ) -> QDoubleSpinBox:
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-
-        lbl = QLabel(label)
+        spin.valueChanged.connect(partial(self._on_changed, config_key))
+        form.addRow(label, spin)
         if tooltip:
-            lbl.setToolTip(tooltip)
-        row_layout.addWidget(lbl)
+            form.labelForField(spin).setToolTip(tooltip)
+        return spin
 
-        spin = QDoubleSpinBox()
-        spin.setRange(min_val, max_val)
-        spin.setValue(default)
-        spin.setSingleStep(step)
-        spin.setMaximumWidth(100)
+    def _add_check_row(
+        self, form: QFormLayout, config_key: str, label: str, tooltip: str = "",
+    ) -> QCheckBox:
+        check = QCheckBox(label)
         if tooltip:
-            spin.setToolTip(tooltip)
-        spin.valueChanged.connect(lambda v, k=config_key: self._on_changed(k, v))
-        row_layout.addWidget(spin)
-
-        parent_layout.addWidget(row)
-        return spin
+            check.setToolTip(tooltip)
+        check.toggled.connect(partial(self._on_flag_toggled, config_key))
+        form.addRow(check)
+        return check
 
     def _on_mal_mode_changed(self, index: int) -> None:
         mode_id = self._mal_mode.itemData(index)
         if mode_id is not None:
             self._on_changed("mal_mode", mode_id)
 
+    def _on_flag_toggled(self, key: str, checked: bool) -> None:
+        self._on_changed(key, 1 if checked else 0)
+
     def _on_changed(self, key: str, value) -> None:
-        if self._controller is not None:
-            self._controller.update_config(**{key: value})
+        self._config_writer.set(key, value)
 
     def _load_from_config(self) -> None:
         if self._controller is None or self._controller.simulation is None:
             return
         cfg = self._controller.simulation.config
-
-        # Allocation
-        idx = self._mal_mode.findData(cfg.mal_mode)
-        if idx >= 0:
-            self._mal_mode.setCurrentIndex(idx)
-
-        # Reaper
-        self._reap_rnd_prop.setValue(cfg.reap_rnd_prop)
-        self._mal_reap_tol_check.setChecked(bool(cfg.mal_reap_tol))
-        self._mal_tol.setValue(cfg.mal_tol)
-
-        # Division
-        self._div_same_siz.setChecked(bool(cfg.div_same_siz))
-        self._div_same_gen.setChecked(bool(cfg.div_same_gen))
-        self._mov_prop_thr_div.setValue(cfg.mov_prop_thr_div)
-
-        # Cell
-        self._min_cell_size.setValue(cfg.min_cell_size)
-        self._search_limit.setValue(cfg.search_limit)
-
-        # Disturbance
-        self._dist_prop.setValue(cfg.dist_prop)
+        # Values come from the config, so don't write them back to it
+        widgets = (self._mal_mode, *self._spins.values(), *self._checks.values())
+        with ExitStack() as stack:
+            for widget in widgets:
+                stack.enter_context(QSignalBlocker(widget))
+            idx = self._mal_mode.findData(cfg.mal_mode)
+            if idx >= 0:
+                self._mal_mode.setCurrentIndex(idx)
+            for key, spin in self._spins.items():
+                spin.setValue(getattr(cfg, key))
+            for key, check in self._checks.items():
+                check.setChecked(bool(getattr(cfg, key)))
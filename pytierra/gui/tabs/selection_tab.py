@@ -1,7 +1,10 @@
 """Selection settings tab — slice size, lazy tolerance controls."""
 
+from contextlib import ExitStack
+from functools import partial
 from typing import Optional
 
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
     QCheckBox, QDoubleSpinBox, QGroupBox, QHBoxLayout, QLabel,
     QSpinBox, QVBoxLayout, QWidget,
@@ -9,6 +12,8 @@ from PySide6.QtWidgets import (
 
 from pytierra.controller import SimulationController
 
+from . import ConfigWriter
+
 
 class SelectionTab(QWidget):
     """Settings panel for time-slicing and selection pressure."""
@@ -16,10 +21,12 @@ class SelectionTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._controller: Optional[SimulationController] = None
+        self._config_writer = ConfigWriter(self)
         self._setup_ui()
 
     def set_controller(self, controller: SimulationController) -> None:
         self._controller = controller
+        self._config_writer.set_controller(controller)
         self._load_from_config()
 
     def _setup_ui(self) -> None:
@@ -41,7 +48,7 @@ class SelectionTab(QWidget):
         self._slice_size.setValue(25)
         self._slice_size.setToolTip("Number of instructions per time slice (when not size-dependent)")
         self._slice_size.valueChanged.connect(
-            lambda v: self._on_changed("slice_size", v)
+            partial(self._on_changed, "slice_size")
         )
         row_layout.addWidget(self._slice_size)
         slice_layout.addWidget(row)
@@ -65,7 +72,7 @@ class SelectionTab(QWidget):
         self._slice_pow.setSingleStep(0.1)
         self._slice_pow.setToolTip("Exponent for size-dependent slicing")
         self._slice_pow.valueChanged.connect(
-            lambda v: self._on_changed("slice_pow", v)
+            partial(self._on_changed, "slice_pow")
         )
         row2_layout.addWidget(self._slice_pow)
         slice_layout.addWidget(row2)
@@ -86,7 +93,7 @@ class SelectionTab(QWidget):
         self._slic_fix_frac.setSingleStep(0.1)
         self._slic_fix_frac.setToolTip("Multiplier for fixed part of slice")
         self._slic_fix_frac.valueChanged.connect(
-            lambda v: self._on_changed("slic_fix_frac", v)
+            partial(self._on_changed, "slic_fix_frac")
         )
         row3_layout.addWidget(self._slic_fix_frac)
         var_layout.addWidget(row3)
@@ -101,7 +108,7 @@ class SelectionTab(QWidget):
         self._slic_ran_frac.setSingleStep(0.1)
         self._slic_ran_frac.setToolTip("Multiplier for random part of slice")
         self._slic_ran_frac.valueChanged.connect(
-            lambda v: self._on_changed("slic_ran_frac", v)
+            partial(self._on_changed, "slic_ran_frac")
         )
         row4_layout.addWidget(self._slic_ran_frac)
         var_layout.addWidget(row4)
@@ -123,7 +130,7 @@ class SelectionTab(QWidget):
             "Kill cell if instructions > size * lazy_tol without reproducing. 0 = disabled."
         )
         self._lazy_tol.valueChanged.connect(
-            lambda v: self._on_changed("lazy_tol", v)
+            partial(self._on_changed, "lazy_tol")
         )
         row5_layout.addWidget(self._lazy_tol)
         lazy_layout.addWidget(row5)
@@ -137,17 +144,24 @@ class SelectionTab(QWidget):
         self._slice_pow.setEnabled(checked)
 
     def _on_changed(self, key: str, value) -> None:
-        if self._controller is not None:
-            self._controller.update_config(**{key: value})
+        self._config_writer.set(key, value)
 
     def _load_from_config(self) -> None:
         if self._controller is None or self._controller.simulation is None:
             return
         cfg = self._controller.simulation.config
-        self._slice_size.setValue(cfg.slice_size)
-        self._siz_dep_check.setChecked(bool(cfg.siz_dep_slice))
-        self._slice_pow.setValue(cfg.slice_pow)
+        # Values come from the config, so don't write them back to it
+        widgets = (
+            self._slice_size, self._siz_dep_check, self._slice_pow,
+            self._slic_fix_frac, self._slic_ran_frac, self._lazy_tol,
+        )
+        with ExitStack() as stack:
+            for widget in widgets:
+                stack.enter_context(QSignalBlocker(widget))
+            self._slice_size.setValue(cfg.slice_size)
+            self._siz_dep_check.setChecked(bool(cfg.siz_dep_slice))
+            self._slice_pow.setValue(cfg.slice_pow)
+            self._slic_fix_frac.setValue(cfg.slic_fix_frac)
+            self._slic_ran_frac.setValue(cfg.slic_ran_frac)
+            self._lazy_tol.setValue(cfg.lazy_tol)
         self._slice_pow.setEnabled(bool(cfg.siz_dep_slice))
-        self._slic_fix_frac.setValue(cfg.slic_fix_frac)
-        self._slic_ran_frac.setValue(cfg.slic_ran_frac)
-        self._lazy_tol.setValue(cfg.lazy_tol)
@@ -3,6 +3,10 @@
 import random
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from .soup import PROT_WRITE
+
 if TYPE_CHECKING:
     from .simulation import Simulation
     from .cell import Cell
@@ -10,12 +14,14 @@ if TYPE_CHECKING:
 NOP0 = 0
 NOP1 = 1
 
+_NOPS = bytes([NOP0, NOP1])
+_COMPLEMENT = bytes.maketrans(_NOPS, bytes([NOP1, NOP0]))
+_TEMPLATE_PEEK = 16  # bytes read at once when collecting a template
+
 
 def _flaw(sim: "Simulation") -> int:
     """Return 0 most of the time, occasionally ±1."""
-    if sim.config.rate_flaw <= 0:
-        return 0
-    if random.random() < sim.config.rate_flaw:
+    if sim.flaw_countdown.fire(sim.config.rate_flaw):
         return random.choice([-1, 1])
     return 0
 
@@ -35,78 +41,85 @@ def _find_template(sim: "Simulation", ip: int, direction: str) -> tuple[int, int
     soup = sim.soup
     soup_size = sim.config.soup_size
 
-    # Read template: collect consecutive nop0/nop1 starting at ip+1
-    template = []
-    pos = (ip + 1) % soup_size
-    while soup.read(pos) in (NOP0, NOP1):
-        template.append(soup.read(pos))
-        pos = (pos + 1) % soup_size
-        if len(template) >= soup_size:
-            break  # safety
-
+    # Read template: consecutive nop0/nop1 starting at ip+1
+    template = _read_template(soup.data, ip + 1)
     if not template:
         return (-1, 0)
 
     tlen = len(template)
 
-    # Build complement
-    complement = [1 - bit for bit in template]
-
-    # Calculate search limit
-    avg_size = _avg_cell_size(sim)
-    max_dist = int(sim.config.search_limit * avg_size) if avg_size > 0 else sim.config.soup_size
-
-    def _match_at(start: int) -> bool:
-        for j in range(tlen):
-            if soup.read((start + j) % soup_size) != complement[j]:
-                return False
-        return True
-
-    # Search for complement
-    if direction == 'f':
-        # Forward only: start searching after source template
-        search_start = (ip + 1 + tlen) % soup_size
-        for dist in range(1, max_dist + 1):
-            check = (search_start + dist) % soup_size
-            if _match_at(check):
-                return ((check + tlen) % soup_size, tlen)
-    elif direction == 'b':
-        # Backward only
-        for dist in range(1, max_dist + 1):
-            check = (ip - dist) % soup_size
-            if _match_at(check):
-                return ((check + tlen) % soup_size, tlen)
-    elif direction == 'o':
-        # Outward: alternate forward and backward
-        search_start = (ip + 1 + tlen) % soup_size
-        for dist in range(1, max_dist + 1):
-            # Forward
-            check_f = (search_start + dist) % soup_size
-            if _match_at(check_f):
-                return ((check_f + tlen) % soup_size, tlen)
-            # Backward
-            check_b = (ip - dist) % soup_size
-            if _match_at(check_b):
-                return ((check_b + tlen) % soup_size, tlen)
-
+    # Build complement as a byte pattern. Soup bytes are always opcodes
+    # (0..31), so matching whole bytes is the same as matching nops and
+    # bytes.find can compare the pattern without any masking.
+    pattern = template.translate(_COMPLEMENT)
+
+    max_dist = sim.search_dist
+    if max_dist <= 0:
+        return (-1, tlen)
+
+    # Search for complement. Each direction copies the candidate window
+    # once and lets bytes.find/rfind scan it in C; dist is the distance
+    # (1..max_dist) of the nearest match in that direction, 0 if none.
+    dist_f = dist_b = 0
+    if direction in ('f', 'o'):
+        # Forward: candidates search_start+1 .. search_start+max_dist,
+        # where search_start is just past the source template
+        first_f = (ip + 1 + tlen) % soup_size + 1
+        idx = _window(soup.data, first_f, max_dist + tlen - 1).find(pattern)
+        if idx >= 0:
+            dist_f = idx + 1
+    if direction in ('b', 'o'):
+        # Backward: candidates ip-1 down to ip-reach. Outward alternates
+        # forward then backward at each distance, so forward wins ties
+        # and after a forward hit only strictly nearer ones can matter.
+        reach = dist_f - 1 if dist_f else max_dist
+        if reach > 0:
+            idx = _window(soup.data, ip - reach, reach + tlen - 1).rfind(pattern)
+            if idx >= 0:
+                dist_b = reach - idx
+
+    # Any backward hit is strictly nearer than the forward one
+    if dist_b:
+        return ((ip - dist_b + tlen) % soup_size, tlen)
+    if dist_f:
+        return ((first_f + dist_f - 1 + tlen) % soup_size, tlen)
     return (-1, tlen)
 
 
-def _avg_cell_size(sim: "Simulation") -> int:
-    """Return average cell size in the population."""
-    if not sim.scheduler.queue:
-        return 80  # default
-    total = sum(c.mm.size for c in sim.scheduler.queue)
-    return total // len(sim.scheduler.queue)
-
+def _read_template(data, start: int) -> bytes:
+    """Return the run of nop bytes starting at start (at most soup size).
 
-def _skip_template(cell: "Cell", soup_size: int, soup) -> None:
-    """Advance IP past any nop template following current IP."""
-    pos = (cell.cpu.ip + 1) % soup_size
-    while soup.read(pos) in (NOP0, NOP1):
-        pos = (pos + 1) % soup_size
-    # Set IP to the last nop so the main loop increment brings us to pos
-    cell.cpu.ip = (pos - 1) % soup_size
+    Peeks at a short window and strips the nops in C, widening the
+    window only for unusually long templates.
+    """
+    size = len(data)
+    template = b""
+    pos = start
+    peek = _TEMPLATE_PEEK
+    while True:
+        chunk = _window(data, pos, min(peek, size - len(template)))
+        run = len(chunk) - len(chunk.lstrip(_NOPS))
+        template += chunk[:run]
+        if run < len(chunk) or len(template) >= size:
+            return template
+        pos += run
+        peek *= 2
+
+
+def _window(data, start: int, length: int) -> bytes:
+    """Return length soup bytes starting at start, wrapping around."""
+    size = len(data)
+    start %= size
+    end = start + length
+    if end <= size:
+        return data[start:end].tobytes()
+    return np.take(data, np.arange(start, end), mode='wrap').tobytes()
+
+
+def _skip_template(cell: "Cell", tlen: int, soup_size: int) -> None:
+    """Advance IP past the tlen nops of the template following it."""
+    # Set IP to the last nop so the main loop increment steps past it
+    cell.cpu.ip = (cell.cpu.ip + tlen) % soup_size
 
 
 # === Instruction implementations ===
@@ -118,20 +131,23 @@ def nop(sim: "Simulation", cell: "Cell") -> None:
 
 def not0(sim: "Simulation", cell: "Cell") -> None:
     """Flip low bit of cx."""
-    cell.cpu.cx ^= (1 + _flaw(sim))
-    cell.cpu.set_flags(cell.cpu.cx)
+    cpu = cell.cpu
+    cpu.cx = value = cpu.cx ^ (1 + _flaw(sim))
+    cpu.set_flags(value)
 
 
 def shl(sim: "Simulation", cell: "Cell") -> None:
     """Shift cx left by 1."""
-    cell.cpu.cx <<= (1 + _flaw(sim))
-    cell.cpu.set_flags(cell.cpu.cx)
+    cpu = cell.cpu
+    cpu.cx = value = cpu.cx << (1 + _flaw(sim))
+    cpu.set_flags(value)
 
 
 def zero(sim: "Simulation", cell: "Cell") -> None:
     """Zero cx register (movdd with cc operands)."""
-    cell.cpu.cx = 0 + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.cx)
+    cpu = cell.cpu
+    cpu.cx = value = 0 + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def ifz(sim: "Simulation", cell: "Cell") -> None:
@@ -143,38 +159,44 @@ def ifz(sim: "Simulation", cell: "Cell") -> None:
 
 def sub_cab(sim: "Simulation", cell: "Cell") -> None:
     """cx = ax - bx"""
-    cell.cpu.cx = cell.cpu.ax - cell.cpu.bx + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.cx)
+    cpu = cell.cpu
+    cpu.cx = value = cpu.ax - cpu.bx + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def sub_aac(sim: "Simulation", cell: "Cell") -> None:
     """ax = ax - cx"""
-    cell.cpu.ax = cell.cpu.ax - cell.cpu.cx + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.ax)
+    cpu = cell.cpu
+    cpu.ax = value = cpu.ax - cpu.cx + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def inc_a(sim: "Simulation", cell: "Cell") -> None:
     """Increment ax."""
-    cell.cpu.ax += 1 + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.ax)
+    cpu = cell.cpu
+    cpu.ax = value = cpu.ax + 1 + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def inc_b(sim: "Simulation", cell: "Cell") -> None:
     """Increment bx."""
-    cell.cpu.bx += 1 + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.bx)
+    cpu = cell.cpu
+    cpu.bx = value = cpu.bx + 1 + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def dec_c(sim: "Simulation", cell: "Cell") -> None:
     """Decrement cx."""
-    cell.cpu.cx -= 1 + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.cx)
+    cpu = cell.cpu
+    cpu.cx = value = cpu.cx - (1 + _flaw(sim))
+    cpu.set_flags(value)
 
 
 def inc_c(sim: "Simulation", cell: "Cell") -> None:
     """Increment cx."""
-    cell.cpu.cx += 1 + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.cx)
+    cpu = cell.cpu
+    cpu.cx = value = cpu.cx + 1 + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def push_a(sim: "Simulation", cell: "Cell") -> None:
@@ -227,7 +249,7 @@ def jmpo(sim: "Simulation", cell: "Cell") -> None:
     else:
         cell.cpu.flag_e = True
         if tlen > 0:
-            _skip_template(cell, sim.config.soup_size, sim.soup)
+            _skip_template(cell, tlen, sim.config.soup_size)
 
 
 def jmpb(sim: "Simulation", cell: "Cell") -> None:
@@ -240,7 +262,7 @@ def jmpb(sim: "Simulation", cell: "Cell") -> None:
     else:
         cell.cpu.flag_e = True
         if tlen > 0:
-            _skip_template(cell, sim.config.soup_size, sim.soup)
+            _skip_template(cell, tlen, sim.config.soup_size)
 
 
 def call(sim: "Simulation", cell: "Cell") -> None:
@@ -256,7 +278,7 @@ def call(sim: "Simulation", cell: "Cell") -> None:
     else:
         cell.cpu.flag_e = True
         if tlen > 0:
-            _skip_template(cell, sim.config.soup_size, sim.soup)
+            _skip_template(cell, tlen, sim.config.soup_size)
 
 
 def ret(sim: "Simulation", cell: "Cell") -> None:
@@ -268,35 +290,47 @@ def ret(sim: "Simulation", cell: "Cell") -> None:
 
 def mov_dc(sim: "Simulation", cell: "Cell") -> None:
     """Move cx to dx."""
-    cell.cpu.dx = cell.cpu.cx + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.dx)
+    cpu = cell.cpu
+    cpu.dx = value = cpu.cx + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def mov_ba(sim: "Simulation", cell: "Cell") -> None:
     """Move ax to bx."""
-    cell.cpu.bx = cell.cpu.ax + _flaw(sim)
-    cell.cpu.set_flags(cell.cpu.bx)
+    cpu = cell.cpu
+    cpu.bx = value = cpu.ax + _flaw(sim)
+    cpu.set_flags(value)
 
 
 def movii(sim: "Simulation", cell: "Cell") -> None:
     """Move [bx] to [ax] (copy one instruction). Write only to daughter memory."""
+    soup = sim.soup
+    soup_size = sim.config.soup_size
     src_addr = cell.cpu.bx
     dst_addr = cell.cpu.ax
 
-    # Check write permission: dst must be in daughter memory
-    if not cell.owns_daughter(dst_addr, sim.config.soup_size):
+    # Check write permission: dst must be in daughter memory. This is
+    # owns_daughter() inlined; the wrapped offset is reused below.
+    md = cell.md
+    if md is None:
+        cell.cpu.flag_e = True
+        return
+    offset = (dst_addr - md.pos) % soup_size
+    if offset >= md.size:
         cell.cpu.flag_e = True
         return
 
     # Memory protection: check write access
-    if not sim.soup.check_write(dst_addr, cell, sim.config):
+    if not soup.check(dst_addr, cell, sim.config, PROT_WRITE):
         cell.cpu.flag_e = True
         return
 
-    value = sim.soup.read(src_addr)
+    # Permissions are settled, so copy through the buffer directly
+    data = soup.data
+    value = data[src_addr % soup_size]
 
     # Copy mutation
-    if sim.config.rate_mov_mut > 0 and random.random() < sim.config.rate_mov_mut:
+    if sim.mov_mut_countdown.fire(sim.config.rate_mov_mut):
         if random.random() < sim.config.mut_bit_prop:
             # Flip a random bit
             value ^= (1 << random.randint(0, 4))
@@ -305,13 +339,15 @@ def movii(sim: "Simulation", cell: "Cell") -> None:
             value = random.randint(0, 31)
         cell.d.mutations += 1
 
-    sim.soup.write(dst_addr, value)
+    data[dst_addr % soup_size] = value
     cell.d.mov_daught += 1
 
     # Track offset range for division validation
-    offset = (dst_addr - cell.md.pos) % sim.config.soup_size
-    cell.d.mov_off_min = min(cell.d.mov_off_min, offset)
-    cell.d.mov_off_max = max(cell.d.mov_off_max, offset)
+    d = cell.d
+    if offset < d.mov_off_min:
+        d.mov_off_min = offset
+    if offset > d.mov_off_max:
+        d.mov_off_max = offset
     cell.cpu.flag_e = False
 
 
@@ -325,7 +361,7 @@ def adro(sim: "Simulation", cell: "Cell") -> None:
     else:
         cell.cpu.flag_e = True
     if tlen > 0:
-        _skip_template(cell, sim.config.soup_size, sim.soup)
+        _skip_template(cell, tlen, sim.config.soup_size)
 
 
 def adrb(sim: "Simulation", cell: "Cell") -> None:
@@ -338,7 +374,7 @@ def adrb(sim: "Simulation", cell: "Cell") -> None:
     else:
         cell.cpu.flag_e = True
     if tlen > 0:
-        _skip_template(cell, sim.config.soup_size, sim.soup)
+        _skip_template(cell, tlen, sim.config.soup_size)
 
 
 def adrf(sim: "Simulation", cell: "Cell") -> None:
@@ -351,7 +387,7 @@ def adrf(sim: "Simulation", cell: "Cell") -> None:
     else:
         cell.cpu.flag_e = True
     if tlen > 0:
-        _skip_template(cell, sim.config.soup_size, sim.soup)
+        _skip_template(cell, tlen, sim.config.soup_size)
 
 
 def mal(sim: "Simulation", cell: "Cell") -> None:
@@ -483,3 +519,8 @@ INSTRUCTIONS = {
     30: ("mal",     mal),
     31: ("divide",  divide),
 }
+
+# Opcode-indexed tuples for the interpreter loop: indexing a tuple avoids
+# the dict hash and (name, fn) unpack per executed instruction
+DISPATCH = tuple(INSTRUCTIONS[op][1] for op in range(len(INSTRUCTIONS)))
+NAMES = tuple(INSTRUCTIONS[op][0] for op in range(len(INSTRUCTIONS)))
@@ -1,8 +1,12 @@
 """Mutation, flaw, genetic operators."""
 
+import math
 import random
+import sys
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from .cell import Cell
     from .simulation import Simulation
@@ -11,9 +15,79 @@ NOP0 = 0
 NOP1 = 1
 
 
+def geometric_gap(rate: float) -> int:
+    """Return how many Bernoulli(rate) trials it takes to get a hit.
+
+    Distributed exactly like counting random() < rate draws, but costs a
+    single RNG call per hit. A rate of 0 never hits.
+    """
+    if rate <= 0:
+        return sys.maxsize
+    if rate >= 1:
+        return 1
+    return int(math.log(1.0 - random.random()) / math.log1p(-rate)) + 1
+
+
+def _random_other(pool, cell: "Cell") -> "Cell | None":
+    """Pick a random cell from pool other than cell, or None if there is none.
+
+    Cells appear in pool at most once, so rejecting cell and drawing
+    again keeps the choice uniform without copying the pool.
+    """
+    if not pool or (len(pool) == 1 and pool[0] is cell):
+        return None
+    mate = random.choice(pool)
+    while mate is cell:
+        mate = random.choice(pool)
+    return mate
+
+
+class RateCountdown:
+    """Answers repeated Bernoulli(rate) trials by counting down to the next hit.
+
+    Replaces a random() draw per trial with an integer decrement. Trials
+    are memoryless, so when the rate changes the countdown is simply
+    redrawn at the new rate.
+    """
+
+    __slots__ = ("_rate", "_left")
+
+    def __init__(self) -> None:
+        self._rate = 0.0
+        self._left = sys.maxsize
+
+    def fire(self, rate: float) -> bool:
+        """Run one trial at rate; True if it hits."""
+        if rate != self._rate:
+            self._rate = rate
+            self._left = geometric_gap(rate)
+        self._left -= 1
+        if self._left:
+            return False
+        self._left = geometric_gap(rate)
+        return True
+
+    def take(self, rate: float) -> int:
+        """Check the countdown out for inline use: trials left until a hit.
+
+        The caller decrements it itself, redraws with geometric_gap(rate)
+        after each hit, and hands the remainder back with put().
+        """
+        if rate != self._rate:
+            self._rate = rate
+            self._left = geometric_gap(rate)
+        return self._left
+
+    def put(self, left: int) -> None:
+        """Return a countdown checked out with take()."""
+        self._left = left
+
+
 class Mutations:
     def __init__(self, config):
         self.config = config
+        # One countdown per division-time operator, keyed by its gen_per_* setting
+        self._countdowns: dict[str, RateCountdown] = {}
 
     def update_rates(self, avg_size: int, num_cells: int) -> None:
         """Recalculate mutation rates based on current population."""
@@ -51,6 +125,14 @@ class Mutations:
             value = random.randint(0, 31)
         return value
 
+    def _fires(self, gen_per_key: str) -> bool:
+        """Run this division's 1 / gen_per trial for one genetic operator."""
+        gen_per = getattr(self.config, gen_per_key)
+        countdown = self._countdowns.get(gen_per_key)
+        if countdown is None:
+            countdown = self._countdowns[gen_per_key] = RateCountdown()
+        return countdown.fire(1.0 / gen_per if gen_per > 0 else 0.0)
+
     def genetic_ops(self, cell: "Cell", sim: "Simulation") -> None:
         """Apply genetic operators to daughter at division.
 
@@ -79,10 +161,7 @@ class Mutations:
 
     def _mutation_ops(self, cell: "Cell", sim: "Simulation") -> None:
         """Point mutations in daughter genome."""
-        if self.config.gen_per_div_mut <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_div_mut
-        if random.random() >= rate:
+        if not self._fires("gen_per_div_mut"):
             return
         md = cell.md
         offset = random.randint(0, md.size - 1)
@@ -94,10 +173,7 @@ class Mutations:
 
     def _crossover_inst_same_size(self, cell: "Cell", sim: "Simulation") -> None:
         """Exchange instruction segments with a random same-size genome in the soup."""
-        if self.config.gen_per_cro_ins_sam_siz <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_cro_ins_sam_siz
-        if random.random() >= rate:
+        if not self._fires("gen_per_cro_ins_sam_siz"):
             return
 
         md = cell.md
@@ -108,29 +184,20 @@ class Mutations:
 
         # Pick a crossover point and exchange tails
         cross_point = random.randint(1, md.size - 1)
-        for i in range(cross_point, md.size):
-            d_addr = (md.pos + i) % sim.config.soup_size
-            m_addr = (mate.mm.pos + i) % sim.config.soup_size
-            # Copy from mate into daughter
-            sim.soup.write(d_addr, sim.soup.read(m_addr))
+        sim.soup.copy_block(md.pos + cross_point, mate.mm.pos + cross_point,
+                            md.size - cross_point)
         cell.d.mutations += 1
 
     def _crossover_inst(self, cell: "Cell", sim: "Simulation") -> None:
         """Size-changing instruction-level crossover with a random genome."""
-        if self.config.gen_per_cro_ins <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_cro_ins
-        if random.random() >= rate:
+        if not self._fires("gen_per_cro_ins"):
             return
 
         md = cell.md
         # Find any cell as mate
-        if sim.scheduler.num_cells < 2:
-            return
-        candidates = [c for c in sim.scheduler.queue if c is not cell]
-        if not candidates:
+        mate = _random_other(sim.scheduler.queue, cell)
+        if mate is None:
             return
-        mate = random.choice(candidates)
 
         # Pick crossover points in each genome
         cross_d = random.randint(1, md.size - 1)
@@ -144,18 +211,12 @@ class Mutations:
 
         # Write mate's tail into daughter starting at cross_d
         write_len = min(tail_len, md.size - cross_d)
-        for i in range(write_len):
-            d_addr = (md.pos + cross_d + i) % sim.config.soup_size
-            m_addr = (mate.mm.pos + cross_m + i) % sim.config.soup_size
-            sim.soup.write(d_addr, sim.soup.read(m_addr))
+        sim.soup.copy_block(md.pos + cross_d, mate.mm.pos + cross_m, write_len)
         cell.d.mutations += 1
 
     def _insertion_inst(self, cell: "Cell", sim: "Simulation") -> None:
         """Insert a random instruction into daughter genome."""
-        if self.config.gen_per_ins_ins <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_ins_ins
-        if random.random() >= rate:
+        if not self._fires("gen_per_ins_ins"):
             return
 
         md = cell.md
@@ -164,46 +225,34 @@ class Mutations:
         pos = random.randint(0, md.size - 1)
         addr = (md.pos + pos) % sim.config.soup_size
         # Shift everything after pos forward by 1 (within daughter bounds)
-        for i in range(md.size - 1, pos, -1):
-            src = (md.pos + i - 1) % sim.config.soup_size
-            dst = (md.pos + i) % sim.config.soup_size
-            sim.soup.write(dst, sim.soup.read(src))
+        sim.soup.copy_block(addr + 1, addr, md.size - 1 - pos)
         sim.soup.write(addr, random.randint(0, 31))
         cell.d.mutations += 1
 
     def _deletion_inst(self, cell: "Cell", sim: "Simulation") -> None:
         """Delete a random instruction from daughter genome."""
-        if self.config.gen_per_del_ins <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_del_ins
-        if random.random() >= rate:
+        if not self._fires("gen_per_del_ins"):
             return
 
         md = cell.md
         if md.size < self.config.min_cell_size + 1:
             return
         pos = random.randint(0, md.size - 1)
-        for i in range(pos, md.size - 1):
-            src = (md.pos + i + 1) % sim.config.soup_size
-            dst = (md.pos + i) % sim.config.soup_size
-            sim.soup.write(dst, sim.soup.read(src))
+        # Shift everything after pos back by 1
+        sim.soup.copy_block(md.pos + pos, md.pos + pos + 1, md.size - 1 - pos)
         sim.soup.write((md.pos + md.size - 1) % sim.config.soup_size, 0)
         cell.d.mutations += 1
 
     def _crossover_seg(self, cell: "Cell", sim: "Simulation") -> None:
         """Segment-level crossover: exchange NOP-bounded segments with a mate."""
-        if self.config.gen_per_cro_seg <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_cro_seg
-        if random.random() >= rate:
+        if not self._fires("gen_per_cro_seg"):
             return
 
         md = cell.md
         # Find a mate
-        candidates = [c for c in sim.scheduler.queue if c is not cell]
-        if not candidates:
+        mate = _random_other(sim.scheduler.queue, cell)
+        if mate is None:
             return
-        mate = random.choice(candidates)
 
         # Find segments in daughter and mate
         d_segs = self._find_segments(md.pos, md.size, sim)
@@ -217,18 +266,12 @@ class Mutations:
 
         # Copy mate segment into daughter segment position (truncate to fit)
         copy_len = min(d_seg[1], m_seg[1])
-        for i in range(copy_len):
-            d_addr = (d_seg[0] + i) % sim.config.soup_size
-            m_addr = (m_seg[0] + i) % sim.config.soup_size
-            sim.soup.write(d_addr, sim.soup.read(m_addr))
+        sim.soup.copy_block(d_seg[0], m_seg[0], copy_len)
         cell.d.mutations += 1
 
     def _insertion_seg(self, cell: "Cell", sim: "Simulation") -> None:
         """Segment insertion: duplicate a random segment within daughter."""
-        if self.config.gen_per_ins_seg <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_ins_seg
-        if random.random() >= rate:
+        if not self._fires("gen_per_ins_seg"):
             return
 
         md = cell.md
@@ -247,24 +290,16 @@ class Mutations:
             return
 
         # Shift tail forward
-        for i in range(md.size - 1, insert_at + shift_len - 1, -1):
-            src = (md.pos + i - shift_len) % sim.config.soup_size
-            dst = (md.pos + i) % sim.config.soup_size
-            sim.soup.write(dst, sim.soup.read(src))
+        gap = md.pos + insert_at
+        sim.soup.copy_block(gap + shift_len, gap, md.size - insert_at - shift_len)
 
         # Copy segment into gap
-        for i in range(shift_len):
-            src = (seg[0] + i) % sim.config.soup_size
-            dst = (md.pos + insert_at + i) % sim.config.soup_size
-            sim.soup.write(dst, sim.soup.read(src))
+        sim.soup.copy_block(gap, seg[0], shift_len)
         cell.d.mutations += 1
 
     def _deletion_seg(self, cell: "Cell", sim: "Simulation") -> None:
         """Segment deletion: remove a random NOP-bounded segment from daughter."""
-        if self.config.gen_per_del_seg <= 0:
-            return
-        rate = 1.0 / self.config.gen_per_del_seg
-        if random.random() >= rate:
+        if not self._fires("gen_per_del_seg"):
             return
 
         md = cell.md
@@ -281,15 +316,11 @@ class Mutations:
             return
 
         # Shift everything after segment backward
-        for i in range(remaining):
-            src = (md.pos + seg_start_offset + seg_len + i) % sim.config.soup_size
-            dst = (md.pos + seg_start_offset + i) % sim.config.soup_size
-            sim.soup.write(dst, sim.soup.read(src))
+        seg_addr = md.pos + seg_start_offset
+        sim.soup.copy_block(seg_addr, seg_addr + seg_len, remaining)
 
         # Fill freed tail with nop0
-        for i in range(seg_len):
-            addr = (md.pos + md.size - seg_len + i) % sim.config.soup_size
-            sim.soup.write(addr, 0)
+        sim.soup.write_block(md.pos + md.size - seg_len, bytes(seg_len))
         cell.d.mutations += 1
 
     def _find_segments(self, pos: int, size: int, sim: "Simulation") -> list[tuple[int, int]]:
@@ -298,40 +329,21 @@ class Mutations:
         Returns list of (start_addr, length) for each segment.
         Segments are runs of non-NOP instructions bounded by NOP sequences.
         """
-        segments = []
-        i = 0
-        soup = sim.soup
         soup_size = sim.config.soup_size
-
-        while i < size:
-            addr = (pos + i) % soup_size
-            # Skip NOPs
-            if soup.read(addr) in (NOP0, NOP1):
-                i += 1
-                continue
-            # Found start of a segment
-            seg_start = addr
-            seg_len = 0
-            while i < size:
-                a = (pos + i) % soup_size
-                if soup.read(a) in (NOP0, NOP1):
-                    break
-                seg_len += 1
-                i += 1
-            if seg_len > 0:
-                segments.append((seg_start, seg_len))
-
-        return segments
+        genome = sim.soup.view_block(pos, size)
+        # Soup bytes are opcodes 0..31, so anything above NOP1 is code.
+        # Pad with nops so every run has both a rising and falling edge.
+        is_code = np.zeros(size + 2, dtype=np.int8)
+        is_code[1:-1] = genome > NOP1
+        edges = np.flatnonzero(np.diff(is_code)).tolist()
+        return [
+            ((pos + start) % soup_size, end - start)
+            for start, end in zip(edges[::2], edges[1::2])
+        ]
 
     def _find_same_size_mate(self, cell: "Cell", sim: "Simulation") -> "Cell | None":
         """Find a random cell of the same size as cell's daughter."""
         md = cell.md
         if md is None:
             return None
-        candidates = [
-            c for c in sim.scheduler.queue
-            if c is not cell and c.mm.size == md.size
-        ]
-        if not candidates:
-            return None
-        return random.choice(candidates)
+        return _random_other(sim.scheduler.by_size.get(md.size, ()), cell)
@@ -1,8 +1,10 @@
 """Shared path resolution for bundled data files."""
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def default_ancestor_path() -> Path | None:
     """Resolve path to the built-in 0080aaa ancestor genome.
 
@@ -10,7 +12,8 @@ def default_ancestor_path() -> Path | None:
     1. importlib.resources (installed package)
     2. data/genomes/ relative to project root (development checkout)
 
-    Returns None if the file cannot be found.
+    Returns None if the file cannot be found. The result is cached, since
+    the bundled data does not move while the process is running.
     """
     # 1. Installed package data
     try:
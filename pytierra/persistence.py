@@ -1,20 +1,46 @@
 """Save/restore simulation state."""
 
+import mmap
+import os
 import pickle
 import random
+import struct
+import zlib
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .simulation import Simulation
 
+# Checkpoint layout (version 2): magic, header, one (offset, length)
+# entry per out-of-band buffer, the pickled state, then the raw buffers
+# (the soup) at offsets aligned for mmap. The pickled state is
+# zlib-compressed; files from before that start with a raw pickle. The
+# soup is near-random opcodes and stays uncompressed so it can be
+# mapped. Version 1 files are a bare pickle and are still readable.
+_MAGIC = b"PYTIERRA"
+_HEADER = struct.Struct("<QI")  # pickle length, number of buffers
+_BUFFER_ENTRY = struct.Struct("<QQ")  # file offset, length
+_PICKLE_PROTO = b"\x80"  # first byte of an uncompressed protocol 2+ pickle
+
+# Cells and genotypes are stored as flat tuples in these field orders
+# (version 3); earlier versions used nested dicts keyed the same way.
+_CPU_FIELDS = (
+    "ax", "bx", "cx", "dx", "ip", "sp", "stack", "flag_e", "flag_s", "flag_z",
+)
+_DEMOGRAPHICS_FIELDS = (
+    "genotype", "parent_genotype", "fecundity", "inst_executed", "rep_inst",
+    "mutations", "mov_daught", "mov_off_min", "mov_off_max", "birth_time",
+)
+_GENOTYPE_FIELDS = ("name", "genome", "population", "origin_time", "max_pop", "parent")
+
 
 def save_state(sim: "Simulation", path: str) -> None:
     """Serialize complete simulation state to a file."""
     state = {
-        "version": 1,
+        "version": 3,
         "config": sim.config,
-        "soup_data": bytes(sim.soup.data),
+        "soup_data": sim.soup.data,
         "soup_free_blocks": sim.soup.free_blocks,
         "cells": _serialize_cells(sim),
         "scheduler_order": [c._id for c in sim.scheduler.queue],
@@ -25,10 +51,41 @@ def save_state(sim: "Simulation", path: str) -> None:
         "last_repro_inst": sim.last_repro_inst,
         "rng_state": random.getstate(),
     }
+    # The soup array goes out-of-band, so it is written straight from its
+    # memory rather than copied into the pickle stream
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    # Cells and genotypes are repetitive; the fastest level already
+    # shrinks them about 4x
+    payload = zlib.compress(payload, 1)
+    views = [buf.raw() for buf in buffers]
+
+    offset = len(_MAGIC) + _HEADER.size + _BUFFER_ENTRY.size * len(views) + len(payload)
+    offsets = []
+    for view in views:
+        offset = _align(offset)
+        offsets.append(offset)
+        offset += view.nbytes
+
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "wb") as f:
-        pickle.dump(state, f, protocol=5)
+    # Write beside the target and swap it in: a soup restored from p is
+    # still mapped from the old file, which must not be truncated
+    tmp = p.with_name(p.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER.pack(len(payload), len(views)))
+        for offset, view in zip(offsets, views):
+            f.write(_BUFFER_ENTRY.pack(offset, view.nbytes))
+        f.write(payload)
+        for offset, view in zip(offsets, views):
+            f.seek(offset)
+            f.write(view)
+        # Make the new file durable before it replaces the old one, so a
+        # crash can't leave an empty checkpoint behind
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, p)
 
 
 def load_state(path: str) -> "Simulation":
@@ -38,8 +95,7 @@ def load_state(path: str) -> "Simulation":
     from .cpu import CPU
     from .genebank import GeneBank, Genotype, SizeClass
 
-    with open(path, "rb") as f:
-        state = pickle.load(f)
+    state = _read_state(path)
 
     config = state["config"]
     sim = Simulation(config=config)
@@ -47,40 +103,38 @@ def load_state(path: str) -> "Simulation":
     # Restore RNG
     random.setstate(state["rng_state"])
 
-    # Restore soup data
-    import numpy as np
-    sim.soup.data = np.frombuffer(bytearray(state["soup_data"]), dtype=np.uint8).copy()
+    # Restore soup data. Version 2 unpickles straight into a writable
+    # array over a copy-on-write map of the file; version 1 stored a
+    # bytes copy.
+    soup_data = state["soup_data"]
+    if isinstance(soup_data, bytes):
+        import numpy as np
+        soup_data = np.frombuffer(bytearray(soup_data), dtype=np.uint8)
+    sim.soup.data = soup_data
     sim.soup.free_blocks = state["soup_free_blocks"]
 
     # Restore cells
+    rows = state["cells"]
+    if state["version"] < 3:
+        rows = [_cell_row_from_dict(cd) for cd in rows]
+    num_cpu = len(_CPU_FIELDS)
     cell_map = {}  # id -> Cell
-    for cd in state["cells"]:
-        cell = Cell(cd["mm_pos"], cd["mm_size"])
-        cell._id = cd["id"]
-        cell.alive = cd["alive"]
-        cell.ib = cd["ib"]
-
-        # CPU
-        cell.cpu.ax = cd["cpu"]["ax"]
-        cell.cpu.bx = cd["cpu"]["bx"]
-        cell.cpu.cx = cd["cpu"]["cx"]
-        cell.cpu.dx = cd["cpu"]["dx"]
-        cell.cpu.ip = cd["cpu"]["ip"]
-        cell.cpu.sp = cd["cpu"]["sp"]
-        cell.cpu.stack = cd["cpu"]["stack"]
-        cell.cpu.flag_e = cd["cpu"]["flag_e"]
-        cell.cpu.flag_s = cd["cpu"]["flag_s"]
-        cell.cpu.flag_z = cd["cpu"]["flag_z"]
-
-        # Demographics
-        for k, v in cd["demographics"].items():
-            setattr(cell.d, k, v)
+    for cid, mm_pos, mm_size, md_pos, md_size, alive, ib, *rest in rows:
+        cell = Cell(mm_pos, mm_size)
+        cell._id = cid
+        cell.alive = alive
+        cell.ib = ib
+
+        cpu = cell.cpu
+        (cpu.ax, cpu.bx, cpu.cx, cpu.dx, cpu.ip, cpu.sp, cpu.stack,
+         cpu.flag_e, cpu.flag_s, cpu.flag_z) = rest[:num_cpu]
+        cell.d = Demographics(*rest[num_cpu:])
 
         # Daughter memory
-        if cd["md_pos"] is not None:
-            cell.md = MemRegion(cd["md_pos"], cd["md_size"])
+        if md_pos is not None:
+            cell.md = MemRegion(md_pos, md_size)
 
-        cell_map[cd["id"]] = cell
+        cell_map[cid] = cell
         sim.soup.add_owner(cell)
 
     # Restore scheduler order
@@ -102,16 +156,13 @@ def load_state(path: str) -> "Simulation":
             size = sc_data["size"]
             sc = SizeClass()
             sc.next_label = sc_data["next_label"]
-            for gt_data in sc_data["genotypes"]:
-                gt = Genotype(
-                    name=gt_data["name"],
-                    genome=gt_data["genome"],
-                    population=gt_data["population"],
-                    origin_time=gt_data["origin_time"],
-                    max_pop=gt_data["max_pop"],
-                    parent=gt_data["parent"],
-                )
-                ghash = GeneBank._genome_hash(gt.genome)
+            # Older files lack the stored hashes; recompute them from the genomes
+            hashes = sc_data.get("hashes")
+            for i, gt_data in enumerate(sc_data["genotypes"]):
+                if isinstance(gt_data, dict):  # version < 3
+                    gt_data = [gt_data[k] for k in _GENOTYPE_FIELDS]
+                gt = Genotype(*gt_data)
+                ghash = hashes[i] if hashes is not None else GeneBank._genome_hash(gt.genome)
                 sc.genotypes[ghash] = gt
                 sim.genebank.genotypes[gt.name] = gt
             sim.genebank.size_classes[size] = sc
@@ -127,71 +178,90 @@ def load_state(path: str) -> "Simulation":
     return sim
 
 
-def _serialize_cells(sim: "Simulation") -> list[dict]:
-    """Serialize all cells to dicts."""
-    cells = set()
-    for c in sim.scheduler.queue:
-        cells.add(c)
-    if sim.reaper:
-        for c in sim.reaper.queue:
-            cells.add(c)
+def _read_state(path: str) -> dict:
+    """Read a checkpoint, handing its out-of-band buffers to the unpickler."""
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            f.seek(0)
+            return pickle.load(f)  # version 1: plain pickle
+        payload_len, num_buffers = _HEADER.unpack(f.read(_HEADER.size))
+        entries = [
+            _BUFFER_ENTRY.unpack(f.read(_BUFFER_ENTRY.size)) for _ in range(num_buffers)
+        ]
+        payload = f.read(payload_len)
+        if not payload.startswith(_PICKLE_PROTO):
+            payload = zlib.decompress(payload)
+        buffers = [_load_buffer(f, offset, length) for offset, length in entries]
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _load_buffer(f, offset: int, length: int):
+    """Return a writable buffer over length bytes of f at offset."""
+    if not length:
+        return bytearray()
+    if os.name == "nt":
+        # Windows refuses to replace a file that is still mapped, which
+        # would break saving back over the checkpoint a run came from
+        f.seek(offset)
+        return bytearray(f.read(length))
+    # Private copy-on-write map: pages are read lazily and only copied
+    # once the simulation writes to them
+    return mmap.mmap(f.fileno(), length, offset=offset, access=mmap.ACCESS_COPY)
+
+
+def _align(offset: int) -> int:
+    """Round offset up to the next mmap allocation boundary."""
+    granularity = mmap.ALLOCATIONGRANULARITY
+    return -(-offset // granularity) * granularity
 
+
+def _serialize_cells(sim: "Simulation") -> list[tuple]:
+    """Serialize all cells to flat tuples (see _CPU_FIELDS etc.)."""
+    # Every cell joins and leaves the scheduler and reaper together, so
+    # the scheduler queue alone covers the population
     result = []
-    for cell in cells:
-        cd = {
-            "id": cell._id,
-            "mm_pos": cell.mm.pos,
-            "mm_size": cell.mm.size,
-            "md_pos": cell.md.pos if cell.md else None,
-            "md_size": cell.md.size if cell.md else None,
-            "alive": cell.alive,
-            "ib": cell.ib,
-            "cpu": {
-                "ax": cell.cpu.ax,
-                "bx": cell.cpu.bx,
-                "cx": cell.cpu.cx,
-                "dx": cell.cpu.dx,
-                "ip": cell.cpu.ip,
-                "sp": cell.cpu.sp,
-                "stack": cell.cpu.stack[:],
-                "flag_e": cell.cpu.flag_e,
-                "flag_s": cell.cpu.flag_s,
-                "flag_z": cell.cpu.flag_z,
-            },
-            "demographics": {
-                "genotype": cell.d.genotype,
-                "parent_genotype": cell.d.parent_genotype,
-                "fecundity": cell.d.fecundity,
-                "inst_executed": cell.d.inst_executed,
-                "rep_inst": cell.d.rep_inst,
-                "mutations": cell.d.mutations,
-                "mov_daught": cell.d.mov_daught,
-                "mov_off_min": cell.d.mov_off_min,
-                "mov_off_max": cell.d.mov_off_max,
-                "birth_time": cell.d.birth_time,
-            },
-        }
-        result.append(cd)
+    for cell in sim.scheduler.queue:
+        cpu = cell.cpu
+        d = cell.d
+        md = cell.md
+        result.append((
+            cell._id, cell.mm.pos, cell.mm.size,
+            md.pos if md else None, md.size if md else None,
+            cell.alive, cell.ib,
+            cpu.ax, cpu.bx, cpu.cx, cpu.dx, cpu.ip, cpu.sp, cpu.stack[:],
+            cpu.flag_e, cpu.flag_s, cpu.flag_z,
+            d.genotype, d.parent_genotype, d.fecundity, d.inst_executed,
+            d.rep_inst, d.mutations, d.mov_daught, d.mov_off_min,
+            d.mov_off_max, d.birth_time,
+        ))
     return result
 
 
+def _cell_row_from_dict(cd: dict) -> tuple:
+    """Convert a version 1/2 cell dict to the flat row layout."""
+    return (
+        cd["id"], cd["mm_pos"], cd["mm_size"], cd["md_pos"], cd["md_size"],
+        cd["alive"], cd["ib"],
+        *(cd["cpu"][k] for k in _CPU_FIELDS),
+        *(cd["demographics"][k] for k in _DEMOGRAPHICS_FIELDS),
+    )
+
+
 def _serialize_genebank(genebank) -> dict:
     """Serialize genebank to a dict."""
     size_classes = []
     for size, sc in genebank.size_classes.items():
         genotypes = []
-        for ghash, gt in sc.genotypes.items():
-            genotypes.append({
-                "name": gt.name,
-                "genome": gt.genome,
-                "population": gt.population,
-                "origin_time": gt.origin_time,
-                "max_pop": gt.max_pop,
-                "parent": gt.parent,
-            })
+        for gt in sc.genotypes.values():
+            genotypes.append((
+                gt.name, gt.genome, gt.population, gt.origin_time, gt.max_pop, gt.parent,
+            ))
         size_classes.append({
             "size": size,
             "next_label": sc.next_label,
             "genotypes": genotypes,
+            # Genomes are already unique per genotype; keeping their
+            # hashes saves re-hashing every genome on load
+            "hashes": list(sc.genotypes),
         })
     return {"size_classes": size_classes}
@@ -4,6 +4,10 @@ import collections
 import random
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
+
+from .scheduler import QueueIndex
+
 if TYPE_CHECKING:
     from .cell import Cell
     from .simulation import Simulation
@@ -13,15 +17,25 @@ class Reaper:
     def __init__(self, config):
         self.config = config
         self.queue: collections.deque["Cell"] = collections.deque()
+        self._index = QueueIndex()
+        # Mother positions in queue order, for the near-address search.
+        # Only the first len(queue) entries are live.
+        self._positions = np.empty(64, dtype=np.int64)
 
     def add(self, cell: "Cell") -> None:
+        n = len(self.queue)
+        if n == len(self._positions):
+            self._positions = np.resize(self._positions, 2 * n)
+        self._positions[n] = cell.mm.pos
         self.queue.append(cell)
+        self._index.added(cell)
 
     def remove(self, cell: "Cell") -> None:
-        try:
-            self.queue.remove(cell)
-        except ValueError:
-            pass
+        idx = self._index.pop_index(self.queue, cell)
+        if idx is not None:
+            n = len(self.queue)
+            self._positions[idx:n - 1] = self._positions[idx + 1:n]
+            del self.queue[idx]
 
     def reap(self, sim: "Simulation", suggested_addr: int = -1) -> Optional["Cell"]:
         """Kill a cell and return it.
@@ -65,16 +79,16 @@ class Reaper:
         """Try to reap the oldest cell within MalTol*avg_size of addr."""
         avg_size = 80
         if sim.scheduler.num_cells > 0:
-            avg_size = sum(c.mm.size for c in sim.scheduler.queue) // sim.scheduler.num_cells
+            avg_size = sim.scheduler.avg_size
         max_dist = self.config.mal_tol * avg_size
 
-        # Search the reaper queue from oldest (front) for a nearby cell
-        for cell in self.queue:
-            if cell is current_cell:
-                continue
-            dist = min(abs(cell.mm.pos - addr),
-                       sim.config.soup_size - abs(cell.mm.pos - addr))
-            if dist <= max_dist:
+        # Oldest (front-most) cell within range wins
+        soup_size = sim.config.soup_size
+        dist = np.abs(self._positions[:len(self.queue)] - addr)
+        dist = np.minimum(dist, soup_size - dist)
+        for idx in np.flatnonzero(dist <= max_dist).tolist():
+            cell = self.queue[idx]
+            if cell is not current_cell:
                 self._reap_cell(cell, sim)
                 return cell
         return None
@@ -1,5 +1,6 @@
 """Time-slice scheduler (slicer queue)."""
 
+import bisect
 import collections
 import math
 import random
@@ -10,11 +11,47 @@ if TYPE_CHECKING:
     from .config import Config
 
 
+class QueueIndex:
+    """Finds cells in an append-only queue without scanning it.
+
+    Cells only ever join a queue at the back, so their join order
+    increases along the queue and a cell's position can be found by
+    bisecting on it. Removal then costs O(log n) lookups plus the
+    deque's own C-level delete.
+    """
+
+    __slots__ = ("_order", "_next")
+
+    def __init__(self) -> None:
+        self._order: dict["Cell", int] = {}
+        self._next = 0
+
+    def added(self, cell: "Cell") -> None:
+        """Record that cell was appended to the queue."""
+        self._order[cell] = self._next
+        self._next += 1
+
+    def pop_index(self, queue: collections.deque["Cell"], cell: "Cell") -> Optional[int]:
+        """Forget cell and return its position in queue, or None if absent."""
+        order = self._order.get(cell)
+        if order is None:
+            return None
+        idx = bisect.bisect_left(queue, order, key=self._order.__getitem__)
+        del self._order[cell]
+        return idx
+
+
 class Scheduler:
     def __init__(self, config: Optional["Config"] = None):
         self.queue: collections.deque["Cell"] = collections.deque()
+        self._index = QueueIndex()
         self._current_idx: int = 0
         self._config = config
+        self._size_sum: int = 0  # running total of mm.size over the queue
+        # Queued cells grouped by mother size, for same-size mate lookup.
+        # Bucket order is arbitrary: removal swaps the last cell into the gap.
+        self.by_size: dict[int, list["Cell"]] = {}
+        self._bucket_pos: dict["Cell", int] = {}
 
     def compute_slice_size(self, cell: "Cell") -> int:
         """Compute the slice size for a given cell based on config."""
@@ -37,23 +74,31 @@ class Scheduler:
 
     def add(self, cell: "Cell") -> None:
         self.queue.append(cell)
+        self._index.added(cell)
+        self._size_sum += cell.mm.size
+        bucket = self.by_size.setdefault(cell.mm.size, [])
+        self._bucket_pos[cell] = len(bucket)
+        bucket.append(cell)
 
     def remove(self, cell: "Cell") -> None:
-        try:
-            idx = None
-            for i, c in enumerate(self.queue):
-                if c is cell:
-                    idx = i
-                    break
-            if idx is not None:
-                del self.queue[idx]
-                # Adjust current index if needed
-                if idx < self._current_idx:
-                    self._current_idx -= 1
-                elif idx == self._current_idx and self._current_idx >= len(self.queue):
-                    self._current_idx = 0
-        except (ValueError, IndexError):
-            pass
+        idx = self._index.pop_index(self.queue, cell)
+        if idx is None:
+            return
+        del self.queue[idx]
+        self._size_sum -= cell.mm.size
+        bucket = self.by_size[cell.mm.size]
+        pos = self._bucket_pos.pop(cell)
+        last = bucket.pop()
+        if last is not cell:
+            bucket[pos] = last
+            self._bucket_pos[last] = pos
+        if not bucket:
+            del self.by_size[cell.mm.size]
+        # Adjust current index if needed
+        if idx < self._current_idx:
+            self._current_idx -= 1
+        elif idx == self._current_idx and self._current_idx >= len(self.queue):
+            self._current_idx = 0
 
     def current(self) -> Optional["Cell"]:
         if not self.queue:
@@ -69,3 +114,15 @@ class Scheduler:
     @property
     def num_cells(self) -> int:
         return len(self.queue)
+
+    @property
+    def total_size(self) -> int:
+        """Sum of mother cell sizes over the queue."""
+        return self._size_sum
+
+    @property
+    def avg_size(self) -> int:
+        """Average mother cell size, or 0 for an empty queue."""
+        if not self.queue:
+            return 0
+        return self._size_sum // len(self.queue)
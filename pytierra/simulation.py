@@ -1,21 +1,22 @@
 """Main loop orchestration (the 'life()' function)."""
 
+import os
 import random
 import time
 from pathlib import Path
 from typing import Optional
 
 from .config import Config
-from .soup import Soup
+from .soup import Soup, PROT_EXECUTE
 from .cpu import CPU
 from .cell import Cell, MemRegion
 from .scheduler import Scheduler
 from .reaper import Reaper
 from .genebank import GeneBank
-from .mutations import Mutations
+from .mutations import Mutations, RateCountdown, geometric_gap
 from .events import EventBus
 from .datalog import DataCollector
-from .instructions import INSTRUCTIONS
+from .instructions import DISPATCH
 from .genome_io import load_genome, save_genome
 
 
@@ -42,11 +43,24 @@ class Simulation:
         self.last_repro_inst: int = 0  # for drop_dead check
         self._slicer_cycles: int = 0
 
+        # Template search range, refreshed at the start of every slice
+        self.search_dist: int = 0
+        self._update_search_dist()
+
+        # Per-call countdowns for execution flaws and copy mutations, and
+        # the per-instruction one for background mutations
+        self.flaw_countdown = RateCountdown()
+        self.mov_mut_countdown = RateCountdown()
+        self.bkg_mut_countdown = RateCountdown()
+
         # Disturbance tracking
         self._next_disturbance_inst: int = 0
 
         # Disk genebank tracking
         self._last_save_inst: int = 0
+        # .tie files known to exist in _saved_dir
+        self._saved_dir: Optional[Path] = None
+        self._saved_names: set[str] = set()
 
         # Stats
         self._last_report_inst: int = 0
@@ -116,7 +130,7 @@ class Simulation:
                 self.genebank.register(cell, self.soup)
 
         if self.mutations is not None and self.scheduler.num_cells > 0:
-            avg_size = sum(c.mm.size for c in self.scheduler.queue) // self.scheduler.num_cells
+            avg_size = self.scheduler.avg_size
             self.mutations.update_rates(avg_size, self.scheduler.num_cells)
             self._schedule_next_disturbance(avg_size)
 
@@ -151,53 +165,83 @@ class Simulation:
     def run_slice(self, cell: Cell) -> None:
         """Execute one time slice for a cell."""
         slice_size = self.scheduler.compute_slice_size(cell)
+        self._update_search_dist()
+
+        # Hoist per-slice lookups out of the instruction loop. Rates and
+        # protection modes only change between slices (bookkeeping or
+        # the GUI, both under the controller lock).
+        config = self.config
+        soup = self.soup
+        data = soup.data
+        soup_size = config.soup_size
+        cpu = cell.cpu
+        d = cell.d
+        dispatch = DISPATCH
+        rate_mut = config.rate_mut if self.mutations is not None else 0
+        # Instructions left until the next background mutation, counted
+        # down inline rather than drawing random() every instruction
+        mut_left = self.bkg_mut_countdown.take(rate_mut)
+        # Execute permission only depends on the owner when some mode
+        # actually denies execution; the default write-protect doesn't
+        protected = (config.mem_mode_free | config.mem_mode_mine | config.mem_mode_prot) & PROT_EXECUTE
 
         for _ in range(slice_size):
             if not cell.alive:
                 break
 
             # Memory protection: execute check
-            if not self.soup.check_execute(cell.cpu.ip, cell, self.config):
-                cell.cpu.flag_e = True
-                cell.cpu.ip = (cell.cpu.ip + 1) % self.config.soup_size
-                cell.d.inst_executed += 1
-                cell.d.rep_inst += 1
+            if protected and not soup.check(cpu.ip, cell, config, PROT_EXECUTE):
+                cpu.flag_e = True
+                cpu.ip = (cpu.ip + 1) % soup_size
+                d.inst_executed += 1
+                d.rep_inst += 1
                 self.inst_executed += 1
                 continue
 
-            opcode = self.soup.read(cell.cpu.ip) % 32
-            cell.cpu._ip_modified = False
+            opcode = data[cpu.ip % soup_size] % 32
+            cpu._ip_modified = False
 
-            name, execute_fn = INSTRUCTIONS[opcode]
-            execute_fn(self, cell)
+            dispatch[opcode](self, cell)
 
-            if not cell.cpu._ip_modified:
-                cell.cpu.ip = (cell.cpu.ip + 1) % self.config.soup_size
+            if not cpu._ip_modified:
+                cpu.ip = (cpu.ip + 1) % soup_size
 
-            cell.d.inst_executed += 1
-            cell.d.rep_inst += 1
+            d.inst_executed += 1
+            d.rep_inst += 1
             self.inst_executed += 1
 
             # Background mutation check
-            if self.config.rate_mut > 0 and random.random() < self.config.rate_mut:
-                if self.mutations is not None:
-                    self.mutations.background_mutation(self)
+            mut_left -= 1
+            if not mut_left:
+                self.mutations.background_mutation(self)
+                mut_left = geometric_gap(rate_mut)
 
             # Disturbance check
             if self._next_disturbance_inst > 0 and self.inst_executed >= self._next_disturbance_inst:
                 self._do_disturbance()
 
+        self.bkg_mut_countdown.put(mut_left)
+
         # Lazy check — only at end of slice, not per-instruction
         if self.reaper is not None:
             self.reaper.check_lazy(cell, self)
 
+    def _update_search_dist(self) -> None:
+        """Recompute how far template instructions search.
+
+        Candidate addresses repeat every soup_size steps, so searching
+        further than that cannot find anything new.
+        """
+        avg_size = self.scheduler.avg_size or 80  # default for an empty soup
+        self.search_dist = min(int(self.config.search_limit * avg_size), self.config.soup_size)
+
     def _do_disturbance(self) -> None:
         """Apply disturbance if configured."""
         if self.reaper is not None and self.config.dist_freq != 0:
             killed = self.reaper.disturbance(self)
             avg_size = 80
             if self.scheduler.num_cells > 0:
-                avg_size = sum(c.mm.size for c in self.scheduler.queue) // self.scheduler.num_cells
+                avg_size = self.scheduler.avg_size
             self._schedule_next_disturbance(avg_size)
 
     def _schedule_next_disturbance(self, avg_size: int) -> None:
@@ -223,7 +267,7 @@ class Simulation:
     def _periodic_bookkeeping(self) -> None:
         """Update rates, save genotypes to disk."""
         if self.mutations is not None and self.scheduler.num_cells > 0:
-            avg_size = sum(c.mm.size for c in self.scheduler.queue) // self.scheduler.num_cells
+            avg_size = self.scheduler.avg_size
             self.mutations.update_rates(avg_size, self.scheduler.num_cells)
 
         # Disk genebank: periodic save of qualifying genotypes
@@ -247,18 +291,26 @@ class Simulation:
 
         save_dir = Path(self.config.genebank_path)
         save_dir.mkdir(parents=True, exist_ok=True)
+        # One directory scan instead of an exists() check per genotype
+        # on every save
+        if save_dir != self._saved_dir:
+            self._saved_dir = save_dir
+            self._saved_names = {
+                entry.name[:-4] for entry in os.scandir(save_dir)
+                if entry.name.endswith(".tie")
+            }
+        saved = self._saved_names
 
         for gt in self.genebank.genotypes.values():
-            if gt.population <= 0:
+            if gt.population <= 0 or gt.name in saved:
                 continue
             # Check thresholds
             meets_num = gt.population >= self.config.sav_min_num
             meets_mem = (gt.population * len(gt.genome)) / self.config.soup_size >= self.config.sav_thr_mem
             meets_pop = gt.population / num_cells >= self.config.sav_thr_pop
             if meets_num or meets_mem or meets_pop:
-                filepath = save_dir / f"{gt.name}.tie"
-                if not filepath.exists():
-                    save_genome(str(filepath), gt.genome, gt.name, gt.parent)
+                save_genome(str(save_dir / f"{gt.name}.tie"), gt.genome, gt.name, gt.parent)
+                saved.add(gt.name)
 
     def report(self) -> str:
         """Generate a status report string."""
@@ -267,7 +319,7 @@ class Simulation:
         num_genotypes = self.genebank.num_genotypes() if self.genebank else 0
         avg_size = 0
         if self.scheduler.num_cells > 0:
-            avg_size = sum(c.mm.size for c in self.scheduler.queue) // self.scheduler.num_cells
+            avg_size = self.scheduler.avg_size
         free_pct = self.soup.total_free() / self.soup.size * 100
 
         return (
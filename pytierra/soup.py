@@ -2,6 +2,7 @@
 
 import bisect
 import random
+from operator import itemgetter
 from typing import Optional, TYPE_CHECKING
 
 import numpy as np
@@ -14,15 +15,27 @@ PROT_EXECUTE = 1
 PROT_WRITE = 2
 PROT_READ = 4
 
+_block_pos = itemgetter(0)  # bisect key for [pos, size] free blocks
+
 
 class Soup:
     def __init__(self, size: int):
         self.size = size
         self.data = np.zeros(size, dtype=np.uint8)
         # Free list: sorted by position, list of [pos, size]
-        self.free_blocks: list[list[int]] = [[0, size]]
+        self.free_blocks = [[0, size]]
         # Owner tracking: sorted by position, list of (pos, size, cell)
         self._owners: list[tuple[int, int, "Cell"]] = []
+        self._owner_pos: list[int] = []  # _owners positions, for bisect
+
+    @property
+    def free_blocks(self) -> list[list[int]]:
+        return self._free_blocks
+
+    @free_blocks.setter
+    def free_blocks(self, blocks: list[list[int]]) -> None:
+        self._free_blocks = blocks
+        self._free_total = sum(sz for _, sz in blocks)
 
     def read(self, addr: int) -> int:
         return int(self.data[addr % self.size])
@@ -30,27 +43,10 @@ class Soup:
     def write(self, addr: int, value: int) -> None:
         self.data[addr % self.size] = value & 0xFF
 
-    def check_read(self, addr: int, reader: "Cell", config) -> bool:
-        """Check if reader is allowed to read addr. Returns True if allowed."""
-        if config.mem_mode_free == 0 and config.mem_mode_mine == 0 and config.mem_mode_prot == 0:
-            return True  # no protection enabled
-        return self._check_access(addr, reader, config, PROT_READ)
-
-    def check_write(self, addr: int, writer: "Cell", config) -> bool:
-        """Check if writer is allowed to write addr. Returns True if allowed."""
-        if config.mem_mode_free == 0 and config.mem_mode_mine == 0 and config.mem_mode_prot == 0:
-            return True
-        return self._check_access(addr, writer, config, PROT_WRITE)
-
-    def check_execute(self, addr: int, executor: "Cell", config) -> bool:
-        """Check if executor is allowed to execute instruction at addr."""
-        if config.mem_mode_free == 0 and config.mem_mode_mine == 0 and config.mem_mode_prot == 0:
-            return True
-        return self._check_access(addr, executor, config, PROT_EXECUTE)
-
-    def _check_access(self, addr: int, cell: "Cell", config, access_bit: int) -> bool:
-        """Check memory access permission."""
-        addr = addr % self.size
+    def check(self, addr: int, cell: "Cell", config, access_bit: int) -> bool:
+        """Check if cell may access addr the way access_bit (a PROT_* flag) says."""
+        if not (config.mem_mode_free | config.mem_mode_mine | config.mem_mode_prot) & access_bit:
+            return True  # no mode restricts this kind of access
         owner = self.owner_at(addr)
         if owner is None:
             # Free memory
@@ -62,6 +58,18 @@ class Soup:
             # Another creature's memory
             return not (config.mem_mode_prot & access_bit)
 
+    def check_read(self, addr: int, reader: "Cell", config) -> bool:
+        """Check if reader is allowed to read addr. Returns True if allowed."""
+        return self.check(addr, reader, config, PROT_READ)
+
+    def check_write(self, addr: int, writer: "Cell", config) -> bool:
+        """Check if writer is allowed to write addr. Returns True if allowed."""
+        return self.check(addr, writer, config, PROT_WRITE)
+
+    def check_execute(self, addr: int, executor: "Cell", config) -> bool:
+        """Check if executor is allowed to execute instruction at addr."""
+        return self.check(addr, executor, config, PROT_EXECUTE)
+
     def read_block(self, addr: int, size: int) -> bytes:
         addr = addr % self.size
         if addr + size <= self.size:
@@ -71,14 +79,44 @@ class Soup:
         part2 = bytes(self.data[:size - (self.size - addr)])
         return part1 + part2
 
-    def write_block(self, addr: int, data: bytes) -> None:
+    def view_block(self, addr: int, size: int) -> np.ndarray:
+        """Return size bytes at addr as an array, without copying if possible.
+
+        A block that doesn't wrap comes back as a view into the soup, so
+        it reflects (and is only meaningful until) the next write there.
+        """
         addr = addr % self.size
+        if addr + size <= self.size:
+            return self.data[addr:addr + size]
+        return np.concatenate((self.data[addr:], self.data[:size - (self.size - addr)]))
+
+    def write_block(self, addr: int, data: "bytes | np.ndarray") -> None:
+        addr = addr % self.size
+        if not isinstance(data, np.ndarray):
+            data = np.frombuffer(data, dtype=np.uint8)
         if addr + len(data) <= self.size:
-            self.data[addr:addr + len(data)] = np.frombuffer(data, dtype=np.uint8)
+            self.data[addr:addr + len(data)] = data
         else:
             split = self.size - addr
-            self.data[addr:] = np.frombuffer(data[:split], dtype=np.uint8)
-            self.data[:len(data) - split] = np.frombuffer(data[split:], dtype=np.uint8)
+            self.data[addr:] = data[:split]
+            self.data[:len(data) - split] = data[split:]
+
+    def copy_block(self, dst: int, src: int, size: int) -> None:
+        """Copy size bytes from src to dst, wrapping around.
+
+        Overlapping ranges behave like memmove: the source is read in
+        full before anything is written.
+        """
+        if size <= 0:
+            return
+        dst %= self.size
+        src %= self.size
+        if dst + size <= self.size and src + size <= self.size:
+            # Neither range wraps: copy array to array. numpy buffers
+            # overlapping slices of the same array itself.
+            self.data[dst:dst + size] = self.data[src:src + size]
+        else:
+            self.write_block(dst, self.read_block(src, size))
 
     def allocate(self, size: int, mode: int = 1, hint_addr: int = -1,
                  tolerance: int = -1) -> Optional[tuple[int, int]]:
@@ -110,6 +148,8 @@ class Soup:
                 if sz >= size and sz < best_size:
                     best_size = sz
                     best_idx = i
+                    if sz == size:
+                        break  # nothing fits better than exactly
             idx = best_idx
         elif mode == 2:
             adequate = [i for i, (pos, sz) in enumerate(self.free_blocks) if sz >= size]
@@ -137,6 +177,7 @@ class Soup:
             return None
 
         pos, block_size = self.free_blocks[idx]
+        self._free_total -= size
 
         if block_size == size:
             self.free_blocks.pop(idx)
@@ -148,9 +189,14 @@ class Soup:
     def allocate_at(self, addr: int, size: int) -> bool:
         """Allocate a specific region (used during boot). Returns success."""
         addr = addr % self.size
-        for i, (pos, block_size) in enumerate(self.free_blocks):
-            if pos <= addr and pos + block_size >= addr + size:
+        # Blocks are sorted and disjoint: only the last one starting at or
+        # before addr can contain the region
+        i = bisect.bisect_right(self.free_blocks, addr, key=_block_pos) - 1
+        if i >= 0:
+            pos, block_size = self.free_blocks[i]
+            if pos + block_size >= addr + size:
                 self.free_blocks.pop(i)
+                self._free_total -= size
                 if pos < addr:
                     self.free_blocks.insert(i, [pos, addr - pos])
                     i += 1
@@ -166,9 +212,9 @@ class Soup:
         addr = addr % self.size
         new_block = [addr, size]
 
-        positions = [b[0] for b in self.free_blocks]
-        insert_idx = bisect.bisect_left(positions, addr)
+        insert_idx = bisect.bisect_left(self.free_blocks, addr, key=_block_pos)
         self.free_blocks.insert(insert_idx, new_block)
+        self._free_total += size
 
         # Merge with next block
         if insert_idx + 1 < len(self.free_blocks):
@@ -188,43 +234,46 @@ class Soup:
 
     def randomize_block(self, addr: int, size: int) -> None:
         """Fill a block with random instructions (called after reaping)."""
-        for i in range(size):
-            self.data[(addr + i) % self.size] = random.randint(0, 31)
+        if size <= 0:
+            return
+        # One RNG call for the whole block; the low 5 bits of a uniform
+        # byte are a uniform opcode
+        noise = random.getrandbits(8 * size).to_bytes(size, "little")
+        self.write_block(addr, np.frombuffer(noise, dtype=np.uint8) & 31)
 
     def is_free(self, addr: int) -> bool:
         addr = addr % self.size
-        for pos, sz in self.free_blocks:
-            if pos <= addr < pos + sz:
-                return True
-        return False
+        i = bisect.bisect_right(self.free_blocks, addr, key=_block_pos) - 1
+        return i >= 0 and addr < self.free_blocks[i][0] + self.free_blocks[i][1]
 
     def total_free(self) -> int:
-        return sum(sz for _, sz in self.free_blocks)
+        return self._free_total
 
     def add_owner(self, cell: "Cell") -> None:
         """Register a cell as owner of its memory region."""
-        positions = [o[0] for o in self._owners]
-        idx = bisect.bisect_left(positions, cell.mm.pos)
+        idx = bisect.bisect_left(self._owner_pos, cell.mm.pos)
+        self._owner_pos.insert(idx, cell.mm.pos)
         self._owners.insert(idx, (cell.mm.pos, cell.mm.size, cell))
 
     def remove_owner(self, cell: "Cell") -> None:
         """Remove a cell from owner tracking."""
-        for i, (pos, sz, c) in enumerate(self._owners):
-            if c is cell:
-                self._owners.pop(i)
+        idx = bisect.bisect_left(self._owner_pos, cell.mm.pos)
+        for i in range(idx, len(self._owners)):
+            if self._owners[i][2] is cell:
+                del self._owner_pos[i]
+                del self._owners[i]
+                return
+            if self._owner_pos[i] != cell.mm.pos:
                 return
 
     def owner_at(self, addr: int) -> Optional["Cell"]:
         """Find which cell owns the given address."""
         addr = addr % self.size
-        lo, hi = 0, len(self._owners)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            pos, sz, cell = self._owners[mid]
-            if addr < pos:
-                hi = mid
-            elif addr >= pos + sz:
-                lo = mid + 1
-            else:
+        # Regions don't overlap, so only the last one starting at or
+        # before addr can contain it
+        idx = bisect.bisect_right(self._owner_pos, addr) - 1
+        if idx >= 0:
+            pos, sz, cell = self._owners[idx]
+            if addr < pos + sz:
                 return cell
         return None
@@ -16,6 +16,7 @@ class TestController:
     def _make_sim(self):
         config = Config()
         config.soup_size = 10000
+        config.seed = 42  # unseeded runs occasionally go extinct mid-test
         sim = Simulation(config=config)
         sim.boot(ANCESTOR_PATH)
         return sim
@@ -92,3 +93,28 @@ class TestController:
         time.sleep(0.05)
         ctrl.stop()
         assert len(ticks) > 0
+
+    def test_get_genotype_arrays(self):
+        sim = self._make_sim()
+        ctrl = SimulationController(sim)
+        snapshots = ctrl.get_all_genotypes()
+        arrays = ctrl.get_genotype_arrays()
+        assert len(arrays) == len(snapshots) == 1
+        assert list(arrays.names) == [gt.name for gt in snapshots]
+        assert list(arrays.sizes) == [gt.size for gt in snapshots] == [80]
+        assert list(arrays.populations) == [gt.population for gt in snapshots]
+        assert arrays.same_counts(ctrl.get_genotype_arrays())
+        ctrl.inject_genome(bytes([0] * 20), 0)
+        assert not arrays.same_counts(ctrl.get_genotype_arrays())
+
+    def test_get_genotype_table(self):
+        sim = self._make_sim()
+        ctrl = SimulationController(sim)
+        arrays, snapshots = ctrl.get_genotype_table()
+        assert [gt.name for gt in snapshots] == list(arrays.names)
+        # Unchanged since last: no snapshots are built
+        assert ctrl.get_genotype_table(arrays)[1] is None
+        ctrl.inject_genome(bytes([0] * 20), 0)
+        new_arrays, snapshots = ctrl.get_genotype_table(arrays)
+        assert len(snapshots) == len(new_arrays) == 2
+        assert [gt.name for gt in snapshots] == list(new_arrays.names)
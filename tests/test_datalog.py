@@ -1,5 +1,7 @@
 """Tests for data collection and time-series logging."""
 
+import pytest
+
 from pytierra.datalog import TimeSeriesLog, DataCollector
 
 
@@ -30,6 +32,66 @@ class TestTimeSeriesLog:
         log.record(0, 1.0)
         log.clear()
         assert len(log) == 0
+        assert log.total_recorded == 0
+
+    def test_incremental_reads(self):
+        log = TimeSeriesLog(capacity=100)
+        for i in range(5):
+            log.record(i * 10, float(i))
+        assert log.total_recorded == 5
+        assert log.times_from(3) == [30, 40]
+        assert log.values_from(3) == [3.0, 4.0]
+        assert log.values_from(5) == []
+
+    def test_incremental_reads_after_wrap(self):
+        log = TimeSeriesLog(capacity=3)
+        for i in range(5):
+            log.record(i, float(i))
+        assert log.total_recorded == 5
+        assert log.values_from(4) == [4.0]
+        # Points that fell out of the ring buffer are no longer available
+        assert log.values_from(0) == [2.0, 3.0, 4.0]
+
+    def test_series_buffer_sees_clear_and_refill(self):
+        graph_tab = pytest.importorskip("pytierra.gui.tabs.graph_tab")
+        log = TimeSeriesLog(capacity=100)
+        for i in range(3):
+            log.record(i, float(i))
+        buf = graph_tab._SeriesBuffer()
+        buf.sync(log)
+
+        # Clear, then refill past the old count before the next sync
+        log.clear()
+        for i in range(5):
+            log.record(100 + i, 10.0 + i)
+        buf.sync(log)
+        assert buf.values[:buf.size].tolist() == [10.0, 11.0, 12.0, 13.0, 14.0]
+        assert buf.times[:buf.size].tolist() == [100, 101, 102, 103, 104]
+
+    def test_graph_redraws_refill_to_same_count(self, monkeypatch):
+        from types import SimpleNamespace
+
+        graph_tab = pytest.importorskip("pytierra.gui.tabs.graph_tab")
+        from PySide6.QtWidgets import QApplication
+
+        monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication.instance() or QApplication([])  # noqa: F841
+        log = TimeSeriesLog(capacity=100)
+        controller = SimpleNamespace(
+            data_collector=SimpleNamespace(all_series=lambda: {"population_size": log})
+        )
+        tab = graph_tab.GraphTab()
+        for i in range(3):
+            log.record(i, float(i))
+        tab._refresh_time_series(controller, 0)
+
+        # Clear and refill to exactly the old count
+        log.clear()
+        for i in range(3):
+            log.record(100 + i, 10.0 + i)
+        tab._refresh_time_series(controller, 0)
+        _x, y = tab._line.getData()
+        assert y.tolist() == [10.0, 11.0, 12.0]
 
 
 class TestDataCollector:
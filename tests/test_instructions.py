@@ -12,7 +12,7 @@ from pytierra.instructions import (
     push_a, push_b, push_c, push_d,
     pop_a, pop_b, pop_c, pop_d,
     mov_dc, mov_ba, movii, ret,
-    mal, divide,
+    mal, divide, _find_template,
 )
 
 
@@ -200,6 +200,43 @@ class TestIfz:
         assert cell.cpu.ip == old_ip + 1
 
 
+class TestTemplateSearch:
+    def _sim_with_template(self, ip=100):
+        sim = make_sim()
+        sim.soup.data[:] = 5  # no nops anywhere
+        sim.soup.write_block(ip + 1, bytes([1, 1]))  # template nop1 nop1
+        return sim
+
+    def test_forward(self):
+        sim = self._sim_with_template()
+        sim.soup.write_block(150, bytes([0, 0]))
+        assert _find_template(sim, 100, 'f') == (152, 2)
+        assert _find_template(sim, 100, 'b') == (-1, 2)
+
+    def test_backward(self):
+        sim = self._sim_with_template()
+        sim.soup.write_block(60, bytes([0, 0]))
+        assert _find_template(sim, 100, 'b') == (62, 2)
+        assert _find_template(sim, 100, 'f') == (-1, 2)
+
+    def test_outward_prefers_nearest(self):
+        sim = self._sim_with_template()
+        sim.soup.write_block(60, bytes([0, 0]))   # 40 back
+        sim.soup.write_block(150, bytes([0, 0]))  # 47 forward
+        assert _find_template(sim, 100, 'o') == (62, 2)
+        sim.soup.write_block(110, bytes([0, 0]))  # 7 forward
+        assert _find_template(sim, 100, 'o') == (112, 2)
+
+    def test_forward_wraps(self):
+        sim = self._sim_with_template(ip=995)
+        sim.soup.write_block(5, bytes([0, 0]))
+        assert _find_template(sim, 995, 'f') == (7, 2)
+
+    def test_no_template(self):
+        sim = self._sim_with_template()
+        assert _find_template(sim, 200, 'o') == (-1, 0)
+
+
 class TestRet:
     def test_ret(self):
         sim = make_sim()
@@ -60,3 +60,17 @@ class TestMemoryProtection:
         assert soup.check_write(200, cell_a, config) is False
         assert soup.check_execute(200, cell_a, config) is False
         assert soup.check_read(200, cell_a, config) is True
+
+    def test_check_per_owner_category(self):
+        config, soup, cell_a, cell_b = self._setup()
+        for bit in (PROT_READ, PROT_WRITE, PROT_EXECUTE):
+            for free, mine, prot in ((bit, 0, 0), (0, bit, 0), (0, 0, bit)):
+                config.mem_mode_free = free
+                config.mem_mode_mine = mine
+                config.mem_mode_prot = prot
+                assert soup.check(50, cell_a, config, bit) is not bool(free)
+                assert soup.check(150, cell_a, config, bit) is not bool(mine)
+                assert soup.check(250, cell_a, config, bit) is not bool(prot)
+                # Other access kinds are unaffected
+                for other in {PROT_READ, PROT_WRITE, PROT_EXECUTE} - {bit}:
+                    assert soup.check(250, cell_a, config, other) is True
@@ -5,7 +5,7 @@ import pytest
 from pytierra.config import Config
 from pytierra.soup import Soup
 from pytierra.cell import Cell, MemRegion
-from pytierra.mutations import Mutations
+from pytierra.mutations import Mutations, RateCountdown
 from pytierra.simulation import Simulation
 
 
@@ -18,22 +18,44 @@ class TestBackgroundMutation:
 
         random.seed(42)
         # Fill soup with zeros
-        for i in range(100):
-            sim.soup.write(i, 0)
+        zeros = bytes(config.soup_size)
+        sim.soup.write_block(0, zeros)
 
         mutations = Mutations(config)
         # Apply many mutations — at least some should change values
         changed = False
         for _ in range(100):
             mutations.background_mutation(sim)
-            for i in range(100):
-                if sim.soup.read(i) != 0:
-                    changed = True
-                    break
-            if changed:
+            if sim.soup.data.any():
+                changed = True
                 break
         assert changed
 
+    def test_countdown_carries_over_between_slices(self):
+        config = Config()
+        config.soup_size = 1000
+        config.seed = 7
+        config.rate_mut = 0.001
+        config.siz_dep_slice = 0
+        config.slice_style = 0
+        config.slice_size = 25  # fixed slices
+        sim = Simulation(config=config)
+        sim.soup.write_block(0, bytes(1000))  # all nops
+        cell = Cell(0, 80)
+        sim.scheduler.add(cell)
+        hits = []
+        sim.events.subscribe("MUTATION", lambda **kw: hits.append(kw["addr"]))
+
+        countdown = sim.bkg_mut_countdown
+        countdown.take(config.rate_mut)
+        countdown.put(40)
+        sim.run_slice(cell)
+        assert not hits
+        assert countdown.take(config.rate_mut) == 15
+
+        sim.run_slice(cell)
+        assert len(hits) == 1
+
 
 class TestMutationRates:
     def test_rate_calculation(self):
@@ -53,3 +75,43 @@ class TestMutationRates:
         mutations = Mutations(config)
         mutations.update_rates(80, 10)
         assert config.rate_mut == 0.0
+
+
+class TestRateCountdown:
+    def test_zero_rate_never_fires(self):
+        countdown = RateCountdown()
+        assert not any(countdown.fire(0.0) for _ in range(1000))
+
+    def test_certain_rate_always_fires(self):
+        countdown = RateCountdown()
+        assert all(countdown.fire(1.0) for _ in range(100))
+
+    def test_hit_frequency_matches_rate(self):
+        random.seed(42)
+        countdown = RateCountdown()
+        hits = sum(countdown.fire(0.01) for _ in range(100_000))
+        assert 900 < hits < 1100
+
+    def test_rate_change_takes_effect(self):
+        countdown = RateCountdown()
+        for _ in range(100):
+            countdown.fire(0.0)
+        assert countdown.fire(1.0)
+
+    def test_take_and_put(self):
+        countdown = RateCountdown()
+        assert countdown.take(0.5) >= 1
+        countdown.put(1)
+        assert countdown.take(0.5) == 1
+        assert countdown.fire(0.5)
+
+
+class TestFindSegments:
+    def test_runs_between_nops(self):
+        config = Config()
+        config.soup_size = 100
+        sim = Simulation(config=config)
+        sim.soup.write_block(98, bytes([5, 6, 0, 1, 7, 0, 8, 9, 10]))
+        segments = Mutations(config)._find_segments(98, 9, sim)
+        # Genome wraps around the end of the soup
+        assert segments == [(98, 2), (2, 1), (4, 3)]
@@ -1,8 +1,9 @@
 """Tests for save/restore simulation state."""
 
-import tempfile
 import os
 
+import numpy as np
+
 from pytierra.config import Config
 from pytierra.simulation import Simulation
 from pytierra.persistence import save_state, load_state
@@ -13,7 +14,7 @@ ANCESTOR_PATH = os.path.join(
 
 
 class TestPersistence:
-    def test_save_restore_roundtrip(self):
+    def test_save_restore_roundtrip(self, tmp_path):
         """Save a running sim, restore it, verify state matches."""
         config = Config()
         config.soup_size = 10000
@@ -24,23 +25,21 @@ class TestPersistence:
         # Capture state before save
         inst_before = sim.inst_executed
         num_cells_before = sim.scheduler.num_cells
-        soup_snapshot = bytes(sim.soup.data)
-
-        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
-            path = f.name
+        soup_snapshot = sim.soup.data.copy()
 
-        try:
-            save_state(sim, path)
-            restored = load_state(path)
+        path = str(tmp_path / "snap.pkl")
+        save_state(sim, path)
+        restored = load_state(path)
 
-            assert restored.inst_executed == inst_before
-            assert restored.scheduler.num_cells == num_cells_before
-            assert bytes(restored.soup.data) == soup_snapshot
-            assert restored.config.soup_size == 10000
-        finally:
-            os.unlink(path)
+        assert restored.inst_executed == inst_before
+        assert restored.scheduler.num_cells == num_cells_before
+        assert np.array_equal(restored.soup.data, soup_snapshot)
+        assert restored.soup.data.flags.writeable
+        assert restored.config.soup_size == 10000
+        assert ([c._id for c in restored.reaper.queue]
+                == [c._id for c in sim.reaper.queue])
 
-    def test_restored_sim_can_continue(self):
+    def test_restored_sim_can_continue(self, tmp_path):
         """Verify a restored sim can continue running."""
         config = Config()
         config.soup_size = 10000
@@ -48,19 +47,14 @@ class TestPersistence:
         sim.boot(ANCESTOR_PATH)
         sim.run(max_instructions=3000)
 
-        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
-            path = f.name
-
-        try:
-            save_state(sim, path)
-            restored = load_state(path)
-            inst_before = restored.inst_executed
-            restored.run(max_instructions=inst_before + 3000)
-            assert restored.inst_executed > inst_before
-        finally:
-            os.unlink(path)
+        path = str(tmp_path / "snap.pkl")
+        save_state(sim, path)
+        restored = load_state(path)
+        inst_before = restored.inst_executed
+        restored.run(max_instructions=inst_before + 3000)
+        assert restored.inst_executed > inst_before
 
-    def test_genebank_preserved(self):
+    def test_genebank_preserved(self, tmp_path):
         """Verify genebank genotypes survive save/restore."""
         config = Config()
         config.soup_size = 10000
@@ -70,13 +64,76 @@ class TestPersistence:
 
         genotypes_before = set(sim.genebank.genotypes.keys())
 
-        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
-            path = f.name
+        path = str(tmp_path / "snap.pkl")
+        save_state(sim, path)
+        restored = load_state(path)
+        genotypes_after = set(restored.genebank.genotypes.keys())
+        assert genotypes_before == genotypes_after
+        for size, sc in sim.genebank.size_classes.items():
+            restored_sc = restored.genebank.size_classes[size]
+            assert set(restored_sc.genotypes) == set(sc.genotypes)
+
+    def test_resave_over_loaded_checkpoint(self, tmp_path):
+        """A restored soup stays intact when saved back to its own file."""
+        config = Config()
+        config.soup_size = 10000
+        sim = Simulation(config=config)
+        sim.boot(ANCESTOR_PATH)
+        sim.run(max_instructions=3000)
+
+        path = str(tmp_path / "snap.pkl")
+        save_state(sim, path)
+        restored = load_state(path)
+        restored.run(max_instructions=restored.inst_executed + 3000)
+        soup_snapshot = restored.soup.data.copy()
+        save_state(restored, path)
+        assert np.array_equal(restored.soup.data, soup_snapshot)
+        assert np.array_equal(load_state(path).soup.data, soup_snapshot)
+
+    def test_loads_uncompressed_payload(self, tmp_path, monkeypatch):
+        """Checkpoints written before compression still load."""
+        import pytierra.persistence as persistence
+
+        config = Config()
+        config.soup_size = 10000
+        sim = Simulation(config=config)
+        sim.boot(ANCESTOR_PATH)
+        sim.run(max_instructions=3000)
+
+        path = str(tmp_path / "snap.pkl")
+        monkeypatch.setattr(persistence.zlib, "compress", lambda data, level: data)
+        save_state(sim, path)
+        monkeypatch.undo()
+        restored = load_state(path)
+        assert restored.inst_executed == sim.inst_executed
+        assert np.array_equal(restored.soup.data, sim.soup.data)
+
+    def test_windows_reads_buffers_into_memory(self, tmp_path, monkeypatch):
+        """Without mmap the soup buffer is an ordinary writable copy."""
+        import pytierra.persistence as persistence
+
+        config = Config()
+        config.soup_size = 10000
+        sim = Simulation(config=config)
+        sim.boot(ANCESTOR_PATH)
 
-        try:
-            save_state(sim, path)
-            restored = load_state(path)
-            genotypes_after = set(restored.genebank.genotypes.keys())
-            assert genotypes_before == genotypes_after
-        finally:
-            os.unlink(path)
+        path = str(tmp_path / "snap.pkl")
+        save_state(sim, path)
+        monkeypatch.setattr(persistence.os, "name", "nt")
+        state = persistence._read_state(path)
+        monkeypatch.undo()
+        owner = state["soup_data"]
+        while getattr(owner, "base", None) is not None:
+            owner = owner.base
+        assert isinstance(owner.obj, bytearray)  # not an mmap
+        assert np.array_equal(state["soup_data"], sim.soup.data)
+
+    def test_row_layout_matches_dataclasses(self):
+        """Flat cell/genotype rows are built positionally from these fields."""
+        from dataclasses import fields
+        from pytierra.cell import Demographics
+        from pytierra.genebank import Genotype
+        from pytierra.persistence import _DEMOGRAPHICS_FIELDS, _GENOTYPE_FIELDS
+
+        assert _DEMOGRAPHICS_FIELDS == tuple(f.name for f in fields(Demographics))
+        assert _GENOTYPE_FIELDS == tuple(f.name for f in fields(Genotype))
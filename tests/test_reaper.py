@@ -0,0 +1,53 @@
+"""Tests for the reaper queue."""
+
+import random
+
+from pytierra.cell import Cell
+from pytierra.config import Config
+from pytierra.simulation import Simulation
+
+
+def _populated_sim(num_cells: int) -> Simulation:
+    config = Config()
+    config.soup_size = 10000
+    sim = Simulation(config=config)
+    for i in range(num_cells):
+        cell = Cell(i * 100, 80)
+        sim.soup.allocate_at(cell.mm.pos, cell.mm.size)
+        sim.scheduler.add(cell)
+        sim.soup.add_owner(cell)
+        sim.reaper.add(cell)
+    return sim
+
+
+class TestReaper:
+    def test_positions_follow_queue(self):
+        sim = _populated_sim(100)
+        reaper = sim.reaper
+        rng = random.Random(3)
+        for cell in rng.sample(list(reaper.queue), 40):
+            reaper.remove(cell)
+        for i in range(30):
+            reaper.add(Cell(i * 7, 80))
+        expected = [c.mm.pos for c in reaper.queue]
+        assert reaper._positions[:len(reaper.queue)].tolist() == expected
+
+    def test_reap_near_address_takes_oldest_in_range(self):
+        sim = _populated_sim(100)
+        sim.config.mal_tol = 1  # within 80 instructions
+        # Make a later cell the oldest near 5050
+        near = sim.reaper.queue[51]
+        sim.reaper.remove(near)
+        sim.reaper.add(near)
+
+        victim = sim.reaper.reap(sim, suggested_addr=5050)
+        assert victim.mm.pos == 5000
+        victim = sim.reaper.reap(sim, suggested_addr=5050)
+        assert victim is near
+
+    def test_reap_near_address_wraps(self):
+        sim = _populated_sim(100)
+        sim.config.mal_tol = 1
+        sim.scheduler.advance()  # the cell at 0 is no longer executing
+        victim = sim.reaper.reap(sim, suggested_addr=9990)
+        assert victim.mm.pos == 0
@@ -42,3 +42,43 @@ class TestScheduler:
         sched = Scheduler()
         assert sched.current() is None
         assert sched.num_cells == 0
+
+    def test_avg_size_tracks_queue(self):
+        sched = Scheduler()
+        assert sched.avg_size == 0
+        c1 = Cell(0, 80)
+        c2 = Cell(100, 45)
+        sched.add(c1)
+        sched.add(c2)
+        assert sched.total_size == 125
+        assert sched.avg_size == 62
+        sched.remove(c1)
+        assert sched.avg_size == 45
+        sched.remove(c1)  # not queued: no change
+        assert sched.total_size == 45
+
+    def test_by_size_index(self):
+        sched = Scheduler()
+        c1 = Cell(0, 80)
+        c2 = Cell(100, 80)
+        c3 = Cell(200, 45)
+        for c in (c1, c2, c3):
+            sched.add(c)
+        assert sched.by_size == {80: [c1, c2], 45: [c3]}
+        sched.remove(c3)
+        sched.remove(c1)
+        assert sched.by_size == {80: [c2]}
+
+    def test_remove_keeps_order(self):
+        sched = Scheduler()
+        cells = [Cell(i * 100, 80 + i % 3) for i in range(50)]
+        for c in cells:
+            sched.add(c)
+        for i in (0, 49, 25, 10, 11, 30):
+            sched.remove(cells[i])
+            cells[i] = None
+        remaining = [c for c in cells if c is not None]
+        assert list(sched.queue) == remaining
+        assert sorted(map(id, sum(sched.by_size.values(), []))) == sorted(map(id, remaining))
+        sched.remove(Cell(0, 80))  # never queued: ignored
+        assert sched.num_cells == len(remaining)
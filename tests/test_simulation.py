@@ -45,3 +45,29 @@ class TestSimulation:
         report = sim.report()
         assert "Cells: 1" in report
         assert "InstExe:" in report
+
+    def test_disk_bank_saves_each_genotype_once(self, tmp_path):
+        """A genotype file is written on the first save and left alone after."""
+        config = Config()
+        config.soup_size = 10000
+        config.disk_bank = 1
+        config.save_freq = 1
+        config.genebank_path = str(tmp_path)
+        sim = Simulation(config=config)
+        sim.boot(ANCESTOR_PATH)
+
+        sim.inst_executed = 1_000_000
+        sim._save_genotypes_to_disk()
+        saved = tmp_path / "0080aaa.tie"
+        assert saved.exists()
+
+        saved.write_text("kept")
+        sim.inst_executed = 2_000_000
+        sim._save_genotypes_to_disk()
+        assert saved.read_text() == "kept"
+
+        # A new genebank path gets its own copy
+        config.genebank_path = str(tmp_path / "other")
+        sim.inst_executed = 3_000_000
+        sim._save_genotypes_to_disk()
+        assert (tmp_path / "other" / "0080aaa.tie").exists()
@@ -31,6 +31,48 @@ class TestReadWrite:
         block = soup.read_block(98, 3)
         assert block == bytes([10, 20, 30])
 
+    def test_write_block_array(self):
+        import numpy as np
+        soup = Soup(100)
+        soup.write_block(98, np.array([1, 2, 3, 4], dtype=np.uint8))
+        assert soup.read_block(98, 4) == bytes([1, 2, 3, 4])
+
+    def test_view_block(self):
+        soup = Soup(100)
+        soup.write_block(10, bytes([1, 2, 3]))
+        view = soup.view_block(10, 3)
+        assert view.tolist() == [1, 2, 3]
+        soup.write(11, 9)
+        assert view.tolist() == [1, 9, 3]  # a view, not a copy
+        soup.write_block(98, bytes([4, 5, 6]))
+        assert soup.view_block(98, 3).tolist() == [4, 5, 6]
+
+    def test_copy_block_overlapping(self):
+        soup = Soup(100)
+        soup.write_block(97, bytes([1, 2, 3, 4, 5]))
+        soup.copy_block(98, 97, 5)  # shift forward across the wrap
+        assert soup.read_block(97, 6) == bytes([1, 1, 2, 3, 4, 5])
+        soup.copy_block(97, 98, 5)  # and back
+        assert soup.read_block(97, 5) == bytes([1, 2, 3, 4, 5])
+
+    def test_copy_block_overlapping_in_place(self):
+        soup = Soup(100)
+        soup.write_block(10, bytes(range(1, 9)))
+        soup.copy_block(12, 10, 8)
+        assert soup.read_block(10, 10) == bytes([1, 2, 1, 2, 3, 4, 5, 6, 7, 8])
+        soup.copy_block(10, 12, 8)
+        assert soup.read_block(10, 8) == bytes(range(1, 9))
+
+    def test_randomize_block(self):
+        import random
+        soup = Soup(100)
+        random.seed(5)
+        soup.randomize_block(90, 20)  # wraps past the end
+        block = soup.read_block(90, 20)
+        assert all(0 <= b <= 31 for b in block)
+        assert len(set(block)) > 1
+        assert bytes(soup.data[10:90]) == bytes(80)
+
 
 class TestAllocation:
     def test_allocate_at(self):
@@ -82,6 +124,23 @@ class TestAllocation:
         soup.allocate_at(100, 80)
         assert soup.total_free() == 920
 
+    def test_total_free_tracks_free_list(self):
+        import random
+        rng = random.Random(1)
+        soup = Soup(1000)
+        held = []
+        for _ in range(500):
+            if held and rng.random() < 0.5:
+                soup.deallocate(*held.pop(rng.randrange(len(held))))
+            else:
+                result = soup.allocate(rng.randint(1, 60), mode=rng.randint(0, 2))
+                if result is not None:
+                    held.append(result)
+            assert soup.total_free() == sum(sz for _, sz in soup.free_blocks)
+
+        soup.free_blocks = [[0, 10], [50, 5]]  # restored from a checkpoint
+        assert soup.total_free() == 15
+
 
 class TestOwners:
     def test_owner_tracking(self):